@@ -6,8 +6,15 @@ Uses tiktoken for accurate token counting when available.
 """
 
 import asyncio
-from typing import Any
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
 
 from loguru import logger
 
@@ -20,6 +27,47 @@ except ImportError:
     tiktoken = None
 
 
+@lru_cache(maxsize=16)
+def _get_encoder(model: str) -> Any:
+    """
+    Get a tiktoken encoder for a model, shared across guards.
+    
+    Building an encoder is expensive, so one instance is kept per model.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fall back to cl100k_base for unknown models
+        return tiktoken.get_encoding("cl100k_base")
+
+
+# Models whose encoder warm-up has already been started
+_warmed_models: set[str] = set()
+
+
+def _warm_encoder(model: str) -> None:
+    """Load an encoder so the first real count doesn't pay for it."""
+    try:
+        _get_encoder(model).encode("warmup")
+    except Exception as e:
+        logger.debug(f"tiktoken warm-up failed for {model}: {e}")
+
+
+def _start_warmup(model: str) -> None:
+    """
+    Warm a model's encoder in a background thread, once per model.
+    
+    Started on first guard construction rather than at import, since
+    tiktoken's registry lock and concurrent imports can deadlock.
+    """
+    if model in _warmed_models:
+        return
+    _warmed_models.add(model)
+    threading.Thread(
+        target=_warm_encoder, args=(model,), name="tiktoken-warmup", daemon=True
+    ).start()
+
+
 @dataclass
 class CompactionResult:
     """Result of compaction operation."""
@@ -48,6 +96,30 @@ class ContextGuard:
     # Approximate tokens per character for estimation
     CHARS_PER_TOKEN = 4
     
+    # Worst-case tokens per character for the character fast path (CJK text
+    # and emoji can encode to more than one token per character)
+    MAX_TOKENS_PER_CHAR = 3
+    
+    # Above this fraction of max_tokens, compaction bypasses the rubric gate
+    HARD_LIMIT_RATIO = 0.95
+    
+    STRATEGIES = ("always_on", "focus")
+    
+    # Focus strategy: segments scoring below this are summarized
+    FOCUS_KEEP_SCORE = 1.0
+    
+    # Focus strategy: base relevance by segment kind
+    FOCUS_ROLE_WEIGHTS = {"user": 1.0, "assistant": 0.6, "tool": 0.2}
+    
+    # Focus strategy: segments this long get the full length penalty
+    FOCUS_LONG_CHARS = 4000
+    
+    # Focus strategy: fall back to summarizing everything if the selected
+    # segments hold less than this share of the older history
+    FOCUS_MIN_SHARE = 0.5
+    
+    KNOWLEDGE_BLOCK_PREFIX = "[Knowledge Block]\n"
+    
     def __init__(
         self,
         max_tokens: int = 128000,
@@ -57,6 +129,11 @@ class ContextGuard:
         model: str = "",
         save_to_memory: bool = False,
         memory_callback: Any = None,
+        parallel_blocks: int = 4,
+        rubric_gate: bool = False,
+        probe_interval: int = 3,
+        summary_cache_path: Path | None = None,
+        strategy: str = "always_on",
     ):
         """
         Initialize the context guard.
@@ -69,7 +146,16 @@ class ContextGuard:
             model: Model name for token counting (affects encoding).
             save_to_memory: Whether to save summaries to memory.
             memory_callback: Callback function to save to memory (signature: async fn(summary, session_id)).
+            parallel_blocks: Max number of blocks summarized concurrently.
+            rubric_gate: Ask the model whether to compact before summarizing.
+            probe_interval: Checks to skip after the model answers CONTINUE.
+            summary_cache_path: Optional JSON file for reusing summaries across sessions.
+            strategy: "always_on" summarizes everything older than preserve_recent;
+                "focus" summarizes only low-relevance segments into a knowledge block.
         """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown compaction strategy: {strategy}")
+        
         self.max_tokens = max_tokens
         self.threshold = threshold
         self.preserve_recent = preserve_recent
@@ -77,19 +163,37 @@ class ContextGuard:
         self.model = model or self.DEFAULT_MODEL
         self.save_to_memory = save_to_memory
         self._memory_callback = memory_callback
+        self.parallel_blocks = max(1, parallel_blocks)
+        self.rubric_gate = rubric_gate
+        self.probe_interval = probe_interval
+        self._rubric_skip = 0
+        self.strategy = strategy
+        
+        # Persistent summaries keyed by content hash (loaded on first use)
+        self.summary_cache_path = summary_cache_path
+        self._summary_cache: OrderedDict[str, str] | None = None
         
         # Token counting stats
         self._last_count = 0
         self._compaction_count = 0
         
-        # Get tiktoken encoder if available
-        self._encoder = None
+        # Per-message token counts for the last counted list, keyed by id()
+        self._token_cache: dict[int, tuple[dict[str, Any], int]] = {}
+        
+        # Worst-case token budget left below the threshold as of the last
+        # fast-path check, and the list length / last message it was measured at
+        self._headroom = 0
+        self._checked_len = 0
+        self._checked_tail: dict[str, Any] | None = None
+        
+        # Warm the tiktoken encoder in the background (resolved lazily)
         if TIKTOKEN_AVAILABLE:
-            try:
-                self._encoder = tiktoken.encoding_for_model(self.model)
-            except KeyError:
-                # Fall back to cl100k_base for unknown models
-                self._encoder = tiktoken.get_encoding("cl100k_base")
+            _start_warmup(self.model)
+    
+    @property
+    def _encoder(self) -> Any:
+        """Tiktoken encoder for this guard's model, or None without tiktoken."""
+        return _get_encoder(self.model) if TIKTOKEN_AVAILABLE else None
     
     def count_tokens(self, messages: list[dict[str, Any]]) -> int:
         """
@@ -105,49 +209,100 @@ class ContextGuard:
             return self._count_tokens_tiktoken(messages)
         return self._count_tokens_estimate(messages)
     
-    def _count_tokens_tiktoken(self, messages: list[dict[str, Any]]) -> int:
-        """Count tokens using tiktoken."""
+    def count_tokens_incremental(self, messages: list[dict[str, Any]]) -> int:
+        """
+        Count tokens, only encoding messages not seen in the previous call.
+        
+        The agent loop re-checks the same growing list every iteration, so
+        counts are cached per message object. Messages are treated as
+        immutable once appended; the cache is pruned to the given list.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+        
+        Returns:
+            Estimated token count.
+        """
+        cache = self._token_cache
+        fresh: dict[int, tuple[dict[str, Any], int]] = {}
+        missing: list[dict[str, Any]] = []
         total = 0
-        for message in messages:
-            # Count message overhead (role, separators)
-            total += 4  # Approximate overhead per message
-            
-            # Count content
-            content = message.get("content", "")
-            if content:
-                total += len(self._encoder.encode(content))
-            
-            # Count tool calls if present
-            tool_calls = message.get("tool_calls", [])
-            for tc in tool_calls:
-                if isinstance(tc, dict):
-                    func = tc.get("function", {})
-                    total += len(self._encoder.encode(func.get("name", "")))
-                    total += len(self._encoder.encode(func.get("arguments", "")))
         
+        for msg in messages:
+            entry = cache.get(id(msg))
+            if entry is not None and entry[0] is msg:
+                fresh[id(msg)] = entry
+                total += entry[1]
+            else:
+                missing.append(msg)
+        
+        if missing:
+            for msg, count in zip(missing, self._count_per_message(missing)):
+                fresh[id(msg)] = (msg, count)
+                total += count
+        
+        self._token_cache = fresh
         return total
     
-    def _count_tokens_estimate(self, messages: list[dict[str, Any]]) -> int:
-        """Estimate token count without tiktoken."""
-        total = 0
+    def _count_per_message(self, messages: list[dict[str, Any]]) -> list[int]:
+        """Count tokens for each message individually."""
+        if not self._encoder:
+            return [self._count_tokens_estimate([msg]) for msg in messages]
+        
+        counts = [4] * len(messages)
+        texts: list[str] = []
+        owners: list[int] = []
+        for i, message in enumerate(messages):
+            for text in self._message_texts(message):
+                texts.append(text)
+                owners.append(i)
+        
+        if texts:
+            for i, tokens in zip(owners, self._encoder.encode_batch(texts)):
+                counts[i] += len(tokens)
+        
+        return counts
+    
+    @staticmethod
+    def _message_texts(message: dict[str, Any]) -> list[str]:
+        """Collect the countable text fields of a message."""
+        texts = []
+        content = message.get("content", "")
+        if content:
+            texts.append(content)
+        
+        # Tool calls if present
+        for tc in message.get("tool_calls", []):
+            if isinstance(tc, dict):
+                func = tc.get("function", {})
+                texts.append(func.get("name", ""))
+                texts.append(func.get("arguments", ""))
+        
+        return texts
+    
+    def _count_tokens_tiktoken(self, messages: list[dict[str, Any]]) -> int:
+        """Count tokens using tiktoken, encoding all texts in one batch."""
+        # Approximate overhead per message (role, separators)
+        total = 4 * len(messages)
+        texts: list[str] = []
         for message in messages:
-            content = message.get("content", "")
-            if content:
-                total += len(content) // self.CHARS_PER_TOKEN
-            
-            # Tool calls
-            tool_calls = message.get("tool_calls", [])
-            for tc in tool_calls:
-                if isinstance(tc, dict):
-                    func = tc.get("function", {})
-                    total += len(func.get("name", "")) // self.CHARS_PER_TOKEN
-                    total += len(func.get("arguments", "")) // self.CHARS_PER_TOKEN
-            
-            # Overhead per message
-            total += 4
+            texts.extend(self._message_texts(message))
+        
+        if texts:
+            total += sum(map(len, self._encoder.encode_batch(texts)))
         
         return total
     
+    def _count_tokens_estimate(self, messages: list[dict[str, Any]]) -> int:
+        """Estimate token count without tiktoken."""
+        chars = sum(
+            len(text)
+            for message in messages
+            for text in self._message_texts(message)
+        )
+        # One division for the whole list, plus overhead per message
+        return chars // self.CHARS_PER_TOKEN + 4 * len(messages)
+    
     def needs_compaction(self, messages: list[dict[str, Any]]) -> bool:
         """
         Check if compaction is needed.
@@ -158,9 +313,96 @@ class ContextGuard:
         Returns:
             True if token count exceeds threshold.
         """
-        self._last_count = self.count_tokens(messages)
+        return self._count_and_check(messages)[1]
+    
+    def _count_and_check(self, messages: list[dict[str, Any]]) -> tuple[int, bool]:
+        """Count tokens once and compare against the compaction threshold."""
+        if self._below_threshold_by_chars(messages):
+            return self._last_count, False
+        return self._tokenize_and_check(messages)
+    
+    def _tokenize_and_check(self, messages: list[dict[str, Any]]) -> tuple[int, bool]:
+        """Count tokens, without the character fast path, and compare against the threshold."""
+        self._last_count = self.count_tokens_incremental(messages)
+        return self._last_count, self._last_count > int(self.max_tokens * self.threshold)
+    
+    def _below_threshold_by_chars(self, messages: list[dict[str, Any]]) -> bool:
+        """
+        Check the threshold using character counts alone.
+        
+        Text encodes to at most MAX_TOKENS_PER_CHAR tokens per character, so
+        lists whose worst case stays under the threshold skip tokenization.
+        On success the remaining headroom is recorded for _within_headroom.
+        """
         threshold_tokens = int(self.max_tokens * self.threshold)
-        return self._last_count > threshold_tokens
+        chars = sum(len(text) for msg in messages for text in self._message_texts(msg))
+        overhead = 4 * len(messages)
+        worst_case = chars * self.MAX_TOKENS_PER_CHAR + overhead
+        if worst_case > threshold_tokens:
+            self._checked_len = 0
+            return False
+        
+        self._last_count = chars // self.CHARS_PER_TOKEN + overhead
+        self._headroom = threshold_tokens - worst_case
+        self._checked_len = len(messages)
+        self._checked_tail = messages[-1] if messages else None
+        return True
+    
+    def _within_headroom(self, messages: list[dict[str, Any]]) -> bool:
+        """
+        Check whether messages appended since the last check still fit the headroom.
+        
+        Lets compact_if_needed skip the thread-pool hop on agent iterations
+        that only added a few tool results to a context far below the
+        threshold. Only the new messages are measured.
+        """
+        checked = self._checked_len
+        if (
+            not checked
+            or len(messages) < checked
+            or messages[checked - 1] is not self._checked_tail
+        ):
+            return False
+        
+        added = messages[checked:]
+        chars = sum(len(text) for msg in added for text in self._message_texts(msg))
+        overhead = 4 * len(added)
+        cost = chars * self.MAX_TOKENS_PER_CHAR + overhead
+        if cost > self._headroom:
+            return False
+        
+        self._headroom -= cost
+        self._last_count += chars // self.CHARS_PER_TOKEN + overhead
+        self._checked_len = len(messages)
+        self._checked_tail = messages[-1]
+        return True
+    
+    async def acount_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """
+        Async version of count_tokens_incremental.
+        
+        Runs tokenization in a thread pool so long contexts don't block
+        the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.count_tokens_incremental, messages)
+    
+    async def aneeds_compaction(self, messages: list[dict[str, Any]]) -> bool:
+        """Async version of needs_compaction."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.needs_compaction, messages)
+    
+    async def _acount_and_check(self, messages: list[dict[str, Any]]) -> tuple[int, bool]:
+        """
+        Async version of _count_and_check.
+        
+        The character fast path runs on the event loop; only tokenization
+        is offloaded, so the characters are scanned once per check.
+        """
+        if self._below_threshold_by_chars(messages):
+            return self._last_count, False
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._tokenize_and_check, messages)
     
     async def compact(
         self,
@@ -179,9 +421,9 @@ class ContextGuard:
         Returns:
             Tuple of (compacted messages, result info).
         """
-        original_count = self.count_tokens(messages)
+        original_count, needed = await self._acount_and_check(messages)
         
-        if not self.needs_compaction(messages):
+        if not needed:
             return messages, CompactionResult(
                 original_tokens=original_count,
                 compacted_tokens=original_count,
@@ -189,20 +431,33 @@ class ContextGuard:
                 summary_added=False,
             )
         
+        return await self._compact(messages, provider, session_id, original_count)
+    
+    async def _compact(
+        self,
+        messages: list[dict[str, Any]],
+        provider: Any,
+        session_id: str,
+        original_count: int,
+    ) -> tuple[list[dict[str, Any]], CompactionResult]:
+        """Compact messages already known to exceed the threshold."""
         logger.info(f"Context compaction triggered ({original_count} tokens)")
         
+        if self.strategy == "focus":
+            return await self._compact_focus(messages, provider, session_id, original_count)
+        
         # Separate messages to preserve vs. summarize
-        system_messages = []
-        to_summarize = []
-        to_preserve = []
+        cutoff = max(0, len(messages) - self.preserve_recent)
+        head, tail = messages[:cutoff], messages[cutoff:]
         
-        for i, msg in enumerate(messages):
-            if msg.get("role") == "system" and self.preserve_system:
-                system_messages.append(msg)
-            elif i >= len(messages) - self.preserve_recent:
-                to_preserve.append(msg)
-            else:
-                to_summarize.append(msg)
+        if self.preserve_system:
+            system_messages = [m for m in messages if m.get("role") == "system"]
+            to_summarize = [m for m in head if m.get("role") != "system"]
+            to_preserve = [m for m in tail if m.get("role") != "system"]
+        else:
+            system_messages = []
+            to_summarize = head
+            to_preserve = tail
         
         if not to_summarize:
             # Nothing to summarize
@@ -215,16 +470,7 @@ class ContextGuard:
         
         # Generate summary of older messages
         summary = await self._generate_summary(to_summarize, provider)
-        
-        # Save summary to memory if enabled
-        saved_to_memory = False
-        if summary and self.save_to_memory and self._memory_callback:
-            try:
-                await self._memory_callback(summary, session_id)
-                saved_to_memory = True
-                logger.debug(f"Saved conversation summary to memory")
-            except Exception as e:
-                logger.warning(f"Failed to save summary to memory: {e}")
+        saved_to_memory = await self._save_summary(summary, session_id)
         
         # Build new message list
         new_messages = system_messages.copy()
@@ -237,55 +483,250 @@ class ContextGuard:
         
         new_messages.extend(to_preserve)
         
-        # Count new tokens
-        new_count = self.count_tokens(new_messages)
+        return await self._finish_compaction(
+            new_messages, original_count, len(to_summarize), bool(summary), saved_to_memory
+        )
+    
+    async def _compact_focus(
+        self,
+        messages: list[dict[str, Any]],
+        provider: Any,
+        session_id: str,
+        original_count: int,
+    ) -> tuple[list[dict[str, Any]], CompactionResult]:
+        """
+        Summarize only low-relevance older segments into a knowledge block.
+        
+        System prompts and the last preserve_recent messages are kept, as
+        are older segments that score as relevant (short user turns, recent
+        answers). The previous knowledge block is folded into the new summary
+        and replaced at the same position instead of accumulating.
+        """
+        # Keep the tail from starting with tool results cut off from their call
+        cutoff = max(0, len(messages) - self.preserve_recent)
+        while 0 < cutoff < len(messages) and messages[cutoff].get("role") == "tool":
+            cutoff -= 1
+        head, tail = messages[:cutoff], messages[cutoff:]
+        
+        prefix = self.KNOWLEDGE_BLOCK_PREFIX
+        knowledge = next(
+            (
+                m for m in messages
+                if m.get("role") == "system" and (m.get("content") or "").startswith(prefix)
+            ),
+            None,
+        )
+        if knowledge is not None:
+            tail = [m for m in tail if m is not knowledge]
+        
+        system_messages = []
+        older = []
+        for msg in head:
+            if msg.get("role") != "system":
+                older.append(msg)
+            elif msg is not knowledge:
+                system_messages.append(msg)
+        
+        segments = self._segments(older)
+        if not segments:
+            return messages, CompactionResult(
+                original_tokens=original_count,
+                compacted_tokens=original_count,
+                messages_removed=0,
+                summary_added=False,
+            )
+        
+        to_summarize: list[dict[str, Any]] = []
+        kept: list[dict[str, Any]] = []
+        selected_chars = 0
+        total_chars = 0
+        for position, segment in enumerate(segments):
+            chars = sum(len(text) for msg in segment for text in self._message_texts(msg))
+            total_chars += chars
+            if self._segment_score(segment, chars, position, len(segments)) < self.FOCUS_KEEP_SCORE:
+                to_summarize.extend(segment)
+                selected_chars += chars
+            else:
+                kept.extend(segment)
+        
+        # Selection too narrow to get back under the threshold: take everything
+        if selected_chars < total_chars * self.FOCUS_MIN_SHARE:
+            to_summarize, kept = older, []
+        
+        summary_input = ([knowledge] if knowledge else []) + to_summarize
+        summary = await self._generate_summary(summary_input, provider)
+        saved_to_memory = await self._save_summary(summary, session_id)
+        
+        new_messages = system_messages
+        if summary:
+            new_messages.append({
+                "role": "system",
+                "content": f"{prefix}{summary}\n[End Knowledge Block]",
+            })
+        elif knowledge:
+            new_messages.append(knowledge)
+        new_messages.extend(kept)
+        new_messages.extend(tail)
+        
+        return await self._finish_compaction(
+            new_messages, original_count, len(to_summarize), bool(summary), saved_to_memory
+        )
+    
+    @staticmethod
+    def _segments(messages: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Group messages so tool results stay with the assistant turn that called them."""
+        segments: list[list[dict[str, Any]]] = []
+        for msg in messages:
+            if msg.get("role") == "tool" and segments:
+                segments[-1].append(msg)
+            else:
+                segments.append([msg])
+        return segments
+    
+    def _segment_score(
+        self,
+        segment: list[dict[str, Any]],
+        chars: int,
+        position: int,
+        count: int,
+    ) -> float:
+        """Cheap relevance score from segment kind, recency, and length."""
+        first = segment[0]
+        if first.get("tool_calls") or first.get("role") == "tool":
+            kind = "tool"
+        else:
+            kind = first.get("role", "assistant")
+        weight = self.FOCUS_ROLE_WEIGHTS.get(kind, 0.6)
+        recency = (position + 1) / count
+        length_penalty = 0.5 * min(chars / self.FOCUS_LONG_CHARS, 1.0)
+        return weight + recency - length_penalty
+    
+    async def _save_summary(self, summary: str, session_id: str) -> bool:
+        """Save a compaction summary to memory if enabled."""
+        if not (summary and self.save_to_memory and self._memory_callback):
+            return False
+        try:
+            await self._memory_callback(summary, session_id)
+            logger.debug(f"Saved conversation summary to memory")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save summary to memory: {e}")
+            return False
+    
+    async def _finish_compaction(
+        self,
+        new_messages: list[dict[str, Any]],
+        original_count: int,
+        removed: int,
+        summary_added: bool,
+        saved_to_memory: bool,
+    ) -> tuple[list[dict[str, Any]], CompactionResult]:
+        """Count the compacted list and build the result."""
+        # Count new tokens (re-primes the per-message cache for the new list)
+        new_count = await self.acount_tokens(new_messages)
         self._compaction_count += 1
         
         logger.info(
             f"Compacted: {original_count} -> {new_count} tokens "
-            f"(removed {len(to_summarize)} messages)"
+            f"(removed {removed} messages)"
         )
         
         return new_messages, CompactionResult(
             original_tokens=original_count,
             compacted_tokens=new_count,
-            messages_removed=len(to_summarize),
-            summary_added=bool(summary),
+            messages_removed=removed,
+            summary_added=summary_added,
             saved_to_memory=saved_to_memory,
         )
     
-    async def _generate_summary(
-        self,
-        messages: list[dict[str, Any]],
-        provider: Any,
-    ) -> str:
-        """Generate a summary of messages."""
-        if not messages:
-            return ""
+    # Minimum estimated tokens per block before splitting is worthwhile
+    MIN_BLOCK_TOKENS = 1500
+    
+    # Maximum conversation characters included in a summary prompt
+    SUMMARY_CHAR_LIMIT = 4000
+    
+    # Maximum characters kept from each message in a summary prompt
+    SUMMARY_LINE_LIMIT = 500
+    
+    # Maximum persisted summaries (least recently used are dropped)
+    SUMMARY_CACHE_SIZE = 256
+    
+    def _split_blocks(self, messages: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """
+        Split messages into contiguous blocks of roughly equal token size.
+        
+        Reuses the per-message counts from the last threshold check and only
+        tokenizes messages it did not cover; run it in the thread pool.
+        """
+        cache = self._token_cache  # Replaced, never mutated, by count_tokens_incremental
+        counts: list[int | None] = []
+        missing: list[dict[str, Any]] = []
+        for msg in messages:
+            entry = cache.get(id(msg))
+            if entry is not None and entry[0] is msg:
+                counts.append(entry[1])
+            else:
+                counts.append(None)
+                missing.append(msg)
+        if missing:
+            fresh = iter(self._count_per_message(missing))
+            counts = [next(fresh) if count is None else count for count in counts]
+        total = sum(counts)
+        num_blocks = min(self.parallel_blocks, max(1, total // self.MIN_BLOCK_TOKENS))
+        if num_blocks <= 1:
+            return [messages]
+        
+        target = total / num_blocks
+        blocks: list[list[dict[str, Any]]] = [[]]
+        used = 0
+        for msg, count in zip(messages, counts):
+            if used >= target and len(blocks) < num_blocks:
+                blocks.append([])
+                used = 0
+            blocks[-1].append(msg)
+            used += count
+        
+        return blocks
+    
+    def _summary_lines(self, msg: dict[str, Any]) -> Iterator[str]:
+        """Yield the transcript lines for one message."""
+        role = msg.get("role", "unknown")
+        content = msg.get("content", "")
+        
+        if content:
+            if len(content) > self.SUMMARY_LINE_LIMIT:
+                content = content[:self.SUMMARY_LINE_LIMIT]
+            yield f"{role.upper()}: {content}"
         
-        # Build conversation text
+        # Note tool calls
+        for tc in msg.get("tool_calls", []):
+            if isinstance(tc, dict):
+                func = tc.get("function", {})
+                yield f"[Tool: {func.get('name', 'unknown')}]"
+    
+    def _build_summary_prompt(self, messages: list[dict[str, Any]], max_words: int) -> str:
+        """Build the summarization prompt for a block of messages."""
+        # Stop collecting lines once the conversation text limit is reached,
+        # instead of joining everything and truncating afterwards
+        limit = self.SUMMARY_CHAR_LIMIT
         conversation = []
+        used = 0
         for msg in messages:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            
-            if content:
-                conversation.append(f"{role.upper()}: {content[:500]}")
-            
-            # Note tool calls
-            tool_calls = msg.get("tool_calls", [])
-            if tool_calls:
-                for tc in tool_calls:
-                    if isinstance(tc, dict):
-                        func = tc.get("function", {})
-                        conversation.append(
-                            f"[Tool: {func.get('name', 'unknown')}]"
-                        )
-        
-        # Limit conversation text
-        conversation_text = "\n".join(conversation)[:4000]
-        
-        prompt = f"""Summarize this conversation history concisely. Focus on:
+            for line in self._summary_lines(msg):
+                remaining = limit - used
+                if len(line) >= remaining:
+                    if remaining > 0:
+                        conversation.append(line[:remaining])
+                    used = limit
+                    break
+                conversation.append(line)
+                used += len(line) + 1  # Joining newline
+            if used >= limit:
+                break
+        
+        conversation_text = "\n".join(conversation)
+        
+        return f"""Summarize this conversation history concisely. Focus on:
 1. Key topics discussed
 2. Important decisions or conclusions
 3. Any tasks or actions taken
@@ -294,19 +735,112 @@ class ContextGuard:
 Conversation:
 {conversation_text}
 
-Provide a brief summary (max 300 words):"""
-
-        try:
-            response = await provider.chat(
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.3,
-            )
-            return response.content or ""
-        except Exception as e:
-            logger.error(f"Summary generation failed: {e}")
+Provide a brief summary (max {max_words} words):"""
+    
+    async def _generate_summary(
+        self,
+        messages: list[dict[str, Any]],
+        provider: Any,
+    ) -> str:
+        """
+        Generate a summary of messages.
+        
+        Long histories are split into blocks that are summarized
+        concurrently, then joined in order.
+        """
+        if not messages:
+            return ""
+        
+        cache_key = self._summary_key(messages) if self.summary_cache_path else ""
+        if cache_key:
+            cached = self._get_cached_summary(cache_key)
+            if cached:
+                logger.debug("Reusing cached conversation summary")
+                return cached
+        
+        loop = asyncio.get_running_loop()
+        blocks = await loop.run_in_executor(None, self._split_blocks, messages)
+        max_words = max(100, 300 // len(blocks))
+        
+        results = await asyncio.gather(
+            *(
+                provider.chat(
+                    messages=[{"role": "user", "content": self._build_summary_prompt(block, max_words)}],
+                    max_tokens=500,
+                    temperature=0.3,
+                )
+                for block in blocks
+            ),
+            return_exceptions=True,
+        )
+        
+        summaries = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Summary generation failed: {result}")
+            elif result.content:
+                summaries.append(result.content)
+        
+        failed = any(isinstance(result, BaseException) for result in results)
+        
+        if summaries:
+            summary = "\n\n".join(summaries)
+            if cache_key and not failed:
+                await self._store_cached_summary(cache_key, summary)
+            return summary
+        
+        if failed:
             # Fallback: simple truncation note
             return f"[Previous conversation: {len(messages)} messages truncated for context limits]"
+        return ""
+    
+    @staticmethod
+    def _summary_key(messages: list[dict[str, Any]]) -> str:
+        """Content hash identifying a run of messages."""
+        digest = hashlib.blake2b(digest_size=16)
+        for msg in messages:
+            digest.update(json.dumps(msg, sort_keys=True, default=str).encode())
+            digest.update(b"\n")
+        return digest.hexdigest()
+    
+    def _load_summary_cache(self) -> OrderedDict[str, str]:
+        """Load persisted summaries from disk."""
+        if self._summary_cache is None:
+            self._summary_cache = OrderedDict()
+            if self.summary_cache_path and self.summary_cache_path.exists():
+                try:
+                    data = json.loads(self.summary_cache_path.read_text(encoding="utf-8"))
+                    self._summary_cache.update(data.get("summaries", {}))
+                except (json.JSONDecodeError, OSError, AttributeError) as e:
+                    logger.warning(f"Failed to load summary cache: {e}")
+        return self._summary_cache
+    
+    def _get_cached_summary(self, key: str) -> str | None:
+        """Look up a persisted summary, marking it recently used."""
+        cache = self._load_summary_cache()
+        summary = cache.get(key)
+        if summary is not None:
+            cache.move_to_end(key)
+        return summary
+    
+    async def _store_cached_summary(self, key: str, summary: str) -> None:
+        """Persist a summary, evicting the least recently used entries."""
+        cache = self._load_summary_cache()
+        cache[key] = summary
+        while len(cache) > self.SUMMARY_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        data = json.dumps({"summaries": cache})
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._write_summary_cache, data)
+        except OSError as e:
+            logger.warning(f"Failed to save summary cache: {e}")
+    
+    def _write_summary_cache(self, data: str) -> None:
+        """Write the serialized summary cache to disk."""
+        self.summary_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.summary_cache_path.write_text(data, encoding="utf-8")
     
     async def compact_if_needed(
         self,
@@ -325,11 +859,65 @@ Provide a brief summary (max 300 words):"""
         Returns:
             Original or compacted messages.
         """
-        if self.needs_compaction(messages):
-            new_messages, _ = await self.compact(messages, provider, session_id)
+        # Cheap checks on the event loop first; only tokenization is offloaded
+        if self._within_headroom(messages):
+            return messages
+        
+        count, needed = await self._acount_and_check(messages)
+        if needed:
+            if self.rubric_gate and not await self._should_compact(messages, provider):
+                return messages
+            new_messages, _ = await self._compact(messages, provider, session_id, count)
             return new_messages
         return messages
     
+    async def _should_compact(
+        self,
+        messages: list[dict[str, Any]],
+        provider: Any,
+    ) -> bool:
+        """
+        Ask the model whether the context is worth summarizing now.
+        
+        A CONTINUE answer suppresses compaction for the next probe_interval
+        checks. Contexts past HARD_LIMIT_RATIO are always compacted.
+        """
+        if self._last_count > int(self.max_tokens * self.HARD_LIMIT_RATIO):
+            return True
+        
+        if self._rubric_skip > 0:
+            self._rubric_skip -= 1
+            return False
+        
+        recent = "\n".join(
+            line
+            for msg in messages[-self.preserve_recent:]
+            for line in self._summary_lines(msg)
+        )[-2000:]
+        
+        prompt = f"""The conversation context is nearly full. Based on the recent turns below,
+reply COMPRESS if older history can be summarized now, or CONTINUE if the
+current task still needs the full detail. Reply with one word.
+
+Recent turns:
+{recent}"""
+        
+        try:
+            response = await provider.chat(
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=4,
+                temperature=0,
+            )
+        except Exception as e:
+            logger.warning(f"Compaction rubric check failed: {e}")
+            return True
+        
+        if (response.content or "").strip().upper().startswith("CONTINUE"):
+            logger.debug(f"Compaction deferred by rubric for {self.probe_interval} checks")
+            self._rubric_skip = self.probe_interval
+            return False
+        return True
+    
     def get_stats(self) -> dict[str, Any]:
         """Get context guard statistics."""
         return {
@@ -365,6 +953,12 @@ MODEL_CONTEXT_SIZES = {
     "qwen-turbo": 131072,
 }
 
+# Lowercased lookup table and a longest-first alternation for partial matches
+_MODELS_LOWER = {k.lower(): v for k, v in MODEL_CONTEXT_SIZES.items()}
+_MODEL_RE = re.compile(
+    "|".join(map(re.escape, sorted(_MODELS_LOWER, key=len, reverse=True)))
+)
+
 
 def get_context_size(model: str) -> int:
     """
@@ -380,12 +974,17 @@ def get_context_size(model: str) -> int:
     model_name = model.split("/")[-1].lower()
     
     # Check exact match
-    if model_name in MODEL_CONTEXT_SIZES:
-        return MODEL_CONTEXT_SIZES[model_name]
+    if model_name in _MODELS_LOWER:
+        return _MODELS_LOWER[model_name]
+    
+    # Check partial match (known model name inside the given one)
+    match = _MODEL_RE.search(model_name)
+    if match:
+        return _MODELS_LOWER[match.group(0)]
     
-    # Check partial match
-    for key, size in MODEL_CONTEXT_SIZES.items():
-        if key in model_name or model_name in key:
+    # Check truncated names (given name inside a known model name)
+    for key, size in _MODELS_LOWER.items():
+        if model_name in key:
             return size
     
     # Default
@@ -398,6 +997,10 @@ def create_context_guard(
     threshold: float = 0.8,
     save_to_memory: bool = False,
     memory_callback: Any = None,
+    rubric_gate: bool = False,
+    probe_interval: int = 3,
+    summary_cache_path: Path | None = None,
+    strategy: str = "always_on",
 ) -> ContextGuard:
     """
     Create a context guard with appropriate settings for a model.
@@ -408,6 +1011,10 @@ def create_context_guard(
         threshold: Compaction threshold (0.0-1.0).
         save_to_memory: Whether to save summaries to memory.
         memory_callback: Callback function for saving to memory.
+        rubric_gate: Ask the model whether to compact before summarizing.
+        probe_interval: Checks to skip after the model answers CONTINUE.
+        summary_cache_path: Optional JSON file for reusing summaries across sessions.
+        strategy: "always_on" or "focus" (selective compaction into a knowledge block).
     
     Returns:
         Configured ContextGuard instance.
@@ -421,4 +1028,9 @@ def create_context_guard(
         model=model,
         save_to_memory=save_to_memory,
         memory_callback=memory_callback,
+        rubric_gate=rubric_gate,
+        probe_interval=probe_interval,
+        summary_cache_path=summary_cache_path,
+        strategy=strategy,
     )
+
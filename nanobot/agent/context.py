@@ -1,7 +1,10 @@
 """Context builder for assembling agent prompts."""
 
+import asyncio
+import os
+from datetime import datetime
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterable, TYPE_CHECKING
 
 from loguru import logger
 
@@ -26,7 +29,7 @@ class ContextBuilder:
     - Enhanced: Vector search + hybrid retrieval (when enabled)
     """
     
-    BOOTSTRAP_FILES = ["AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md"]
+    BOOTSTRAP_FILES = ("AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md")
     
     def __init__(
         self,
@@ -46,6 +49,18 @@ class ContextBuilder:
         self.simple_memory = SimpleMemoryStore(workspace)
         self.skills = SkillsLoader(workspace)
         
+        # Bootstrap paths, and the subset present as of the workspace mtime
+        self._bootstrap_paths = tuple(workspace / f for f in self.BOOTSTRAP_FILES)
+        self._existing_bootstraps: tuple[Path, ...] = ()
+        self._workspace_mtime: int | None = None
+        
+        # Cached prompt fragments (rebuilt when inputs change)
+        self._bootstrap_cache: tuple[tuple[Path, int], ...] | None = None
+        self._bootstrap_text = ""
+        self._identity: str | None = None
+        self._system_prompt_cache: tuple[tuple[Any, ...], str] | None = None
+        self._memory_section_cache: tuple[tuple[tuple[Path, int], ...], str] | None = None
+        
         # Enhanced memory components (lazy initialized)
         self._enable_vector_search = enable_vector_search
         self._context_memories = context_memories
@@ -106,25 +121,86 @@ class ContextBuilder:
         Returns:
             Complete system prompt.
         """
+        sections = self._build_system_sections(
+            self._load_bootstrap_files(), skill_names, current_query
+        )
+        return self._join_sections(sections)
+    
+    async def abuild_system_prompt(
+        self,
+        skill_names: list[str] | None = None,
+        current_query: str | None = None,
+    ) -> str:
+        """
+        Async version of build_system_prompt.
+        
+        Bootstrap files are read concurrently in a thread pool.
+        """
+        bootstrap = await self._load_bootstrap_files_async()
+        sections = self._build_system_sections(bootstrap, skill_names, current_query)
+        return self._join_sections(sections)
+    
+    @staticmethod
+    def _join_sections(sections: tuple[str, str]) -> str:
+        """Join system prompt sections into one prompt."""
+        return "\n\n---\n\n".join(section for section in sections if section)
+    
+    def _build_system_sections(
+        self,
+        bootstrap: str,
+        skill_names: list[str] | None,
+        current_query: str | None,
+    ) -> tuple[str, str]:
+        """
+        Assemble the system prompt around pre-loaded bootstrap text.
+        
+        Returned as (invariant, memory) so the invariant part can stay a
+        stable, cacheable prompt prefix. It is reused while identity,
+        bootstrap, and skills are unchanged; the memory section is reused
+        while the memory files are unchanged. Semantic memory depends on
+        the query and is always rebuilt.
+        """
+        identity = self._get_identity()
+        key = (
+            identity,
+            bootstrap,
+            tuple(skill_names or ()),
+            self._skills_signature(),
+        )
+        if self._system_prompt_cache and self._system_prompt_cache[0] == key:
+            invariant = self._system_prompt_cache[1]
+        else:
+            invariant = self._assemble_system_prompt(identity, bootstrap)
+            self._system_prompt_cache = (key, invariant)
+        
+        return invariant, self._build_memory_section(current_query)
+    
+    def _build_memory_section(self, current_query: str | None) -> str:
+        """Build the memory section, using semantic search if available and a query is given."""
+        if self._enable_vector_search and current_query and self._hybrid_search:
+            memory = self._get_semantic_memory_context(current_query)
+            return f"# Memory\n\n{memory}" if memory else ""
+        
+        signature = self._memory_signature()
+        if self._memory_section_cache and self._memory_section_cache[0] == signature:
+            return self._memory_section_cache[1]
+        
+        memory = self.simple_memory.get_memory_context()
+        section = f"# Memory\n\n{memory}" if memory else ""
+        self._memory_section_cache = (signature, section)
+        return section
+    
+    def _assemble_system_prompt(self, identity: str, bootstrap: str) -> str:
+        """Join identity, bootstrap, and skills sections."""
         parts = []
         
         # Core identity
-        parts.append(self._get_identity())
+        parts.append(identity)
         
         # Bootstrap files
-        bootstrap = self._load_bootstrap_files()
         if bootstrap:
             parts.append(bootstrap)
         
-        # Memory context - use enhanced search if available and query provided
-        if self._enable_vector_search and current_query and self._hybrid_search:
-            memory = self._get_semantic_memory_context(current_query)
-        else:
-            memory = self.simple_memory.get_memory_context()
-        
-        if memory:
-            parts.append(f"# Memory\n\n{memory}")
-        
         # Skills - progressive loading
         # 1. Always-loaded skills: include full content
         always_skills = self.skills.get_always_skills()
@@ -146,12 +222,19 @@ Skills with available="false" need dependencies installed first - you can try in
         return "\n\n---\n\n".join(parts)
     
     def _get_identity(self) -> str:
-        """Get the core identity section."""
-        from datetime import datetime
-        now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
+        """
+        Get the core identity section.
+        
+        Kept free of per-turn values (like the current time) so the system
+        prompt stays byte-identical across turns and provider prompt caches
+        keep hitting.
+        """
+        if self._identity is not None:
+            return self._identity
+        
         workspace_path = str(self.workspace.expanduser().resolve())
         
-        return f"""# nanobot 🐈
+        identity = f"""# nanobot 🐈
 
 You are nanobot, a helpful AI assistant. You have access to tools that allow you to:
 - Read, write, and edit files
@@ -160,9 +243,6 @@ You are nanobot, a helpful AI assistant. You have access to tools that allow you
 - Send messages to users on chat channels
 - Spawn subagents for complex background tasks
 
-## Current Time
-{now}
-
 ## Workspace
 Your workspace is at: {workspace_path}
 - Memory files: {workspace_path}/memory/MEMORY.md
@@ -175,18 +255,98 @@ For normal conversation, just respond with text - do not call the message tool.
 
 Always be helpful, accurate, and concise. When using tools, explain what you're doing.
 When remembering something, write to {workspace_path}/memory/MEMORY.md"""
+        
+        self._identity = identity
+        return identity
+    
+    def _bootstrap_signature(self) -> tuple[tuple[Path, int], ...]:
+        """Get (path, mtime) pairs for the bootstrap files that exist."""
+        return self._stat_signature(self._existing_bootstrap_paths())
+    
+    def _existing_bootstrap_paths(self) -> tuple[Path, ...]:
+        """
+        Get the bootstrap files present in the workspace.
+        
+        The workspace directory is only rescanned when its mtime changes
+        (a file was added, removed, or renamed).
+        """
+        try:
+            mtime = self.workspace.stat().st_mtime_ns
+        except OSError:
+            return ()
+        
+        if mtime != self._workspace_mtime:
+            with os.scandir(self.workspace) as entries:
+                names = {entry.name for entry in entries}
+            self._existing_bootstraps = tuple(
+                p for p in self._bootstrap_paths if p.name in names
+            )
+            self._workspace_mtime = mtime
+        
+        return self._existing_bootstraps
+    
+    @staticmethod
+    def _stat_signature(paths: Iterable[Path]) -> tuple[tuple[Path, int], ...]:
+        """Get (path, mtime) pairs for the given paths that exist."""
+        stats = []
+        for path in paths:
+            try:
+                stats.append((path, path.stat().st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(stats)
+    
+    def _memory_signature(self) -> tuple[tuple[Path, int], ...]:
+        """Signature of the files read by simple memory context."""
+        return self._stat_signature([
+            self.simple_memory.memory_file,
+            self.simple_memory.get_today_file(),
+        ])
+    
+    def _skills_signature(self) -> tuple[tuple[Path, int], ...]:
+        """Signature of all SKILL.md files (workspace and built-in)."""
+        paths = []
+        for skills_dir in (self.skills.workspace_skills, self.skills.builtin_skills):
+            if skills_dir and skills_dir.is_dir():
+                paths.extend(d / "SKILL.md" for d in skills_dir.iterdir() if d.is_dir())
+        return self._stat_signature(paths)
+    
+    def _store_bootstrap(self, key: tuple[tuple[Path, int], ...], contents: list[str]) -> str:
+        """Format bootstrap file contents and cache the result."""
+        parts = [
+            f"## {file_path.name}\n\n{content}"
+            for (file_path, _), content in zip(key, contents)
+        ]
+        self._bootstrap_cache = key
+        self._bootstrap_text = "\n\n".join(parts) if parts else ""
+        return self._bootstrap_text
     
     def _load_bootstrap_files(self) -> str:
-        """Load all bootstrap files from workspace."""
-        parts = []
+        """
+        Load all bootstrap files from workspace.
         
-        for filename in self.BOOTSTRAP_FILES:
-            file_path = self.workspace / filename
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                parts.append(f"## {filename}\n\n{content}")
+        The combined text is cached and only rebuilt when a file is
+        added, removed, or modified.
+        """
+        key = self._bootstrap_signature()
+        if key == self._bootstrap_cache:
+            return self._bootstrap_text
         
-        return "\n\n".join(parts) if parts else ""
+        contents = [file_path.read_text(encoding="utf-8") for file_path, _ in key]
+        return self._store_bootstrap(key, contents)
+    
+    async def _load_bootstrap_files_async(self) -> str:
+        """Async version of _load_bootstrap_files that reads files concurrently."""
+        key = self._bootstrap_signature()
+        if key == self._bootstrap_cache:
+            return self._bootstrap_text
+        
+        loop = asyncio.get_running_loop()
+        contents = await asyncio.gather(*(
+            loop.run_in_executor(None, lambda p=file_path: p.read_text(encoding="utf-8"))
+            for file_path, _ in key
+        ))
+        return self._store_bootstrap(key, list(contents))
     
     def _get_semantic_memory_context(self, query: str) -> str:
         """
@@ -301,7 +461,6 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             
             # Update vector index
             if self._vector_store and self._enhanced_memory:
-                from datetime import datetime
                 from nanobot.memory.store import MemoryEntry
                 
                 entry = MemoryEntry(
@@ -359,20 +518,53 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         Returns:
             List of messages including system prompt.
         """
-        messages = []
-        
         # System prompt - pass current message for semantic memory if enabled
         query_for_memory = current_message if use_semantic_memory else None
-        system_prompt = self.build_system_prompt(skill_names, query_for_memory)
-        messages.append({"role": "system", "content": system_prompt})
+        sections = self._build_system_sections(
+            self._load_bootstrap_files(), skill_names, query_for_memory
+        )
         
-        # History
-        messages.extend(history)
+        return self._compose_messages(sections, history, current_message)
+    
+    async def abuild_messages(
+        self,
+        history: list[dict[str, Any]],
+        current_message: str,
+        skill_names: list[str] | None = None,
+        use_semantic_memory: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Async version of build_messages (see abuild_system_prompt)."""
+        query_for_memory = current_message if use_semantic_memory else None
+        bootstrap = await self._load_bootstrap_files_async()
+        sections = self._build_system_sections(bootstrap, skill_names, query_for_memory)
         
-        # Current message
-        messages.append({"role": "user", "content": current_message})
+        return self._compose_messages(sections, history, current_message)
+    
+    @staticmethod
+    def _compose_messages(
+        sections: tuple[str, str],
+        history: list[dict[str, Any]],
+        current_message: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Combine system sections, history, and current message in one list build.
         
-        return messages
+        The layout is [static system] -> [memory system] -> [history] ->
+        [current turn]. Each layer changes more often than the one before
+        it, and dynamic values like the current time go on the current turn
+        only, so the longest possible prefix can be served from the
+        provider's prompt cache.
+        """
+        invariant, memory = sections
+        now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
+        system = [{"role": "system", "content": invariant}]
+        if memory:
+            system.append({"role": "system", "content": memory})
+        return [
+            *system,
+            *history,
+            {"role": "user", "content": f"[Current time: {now}]\n\n{current_message}"},
+        ]
     
     def add_tool_result(
         self,
@@ -391,7 +583,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             result: Tool execution result.
         
         Returns:
-            Updated message list.
+            The same list, appended to in place.
         """
         messages.append({
             "role": "tool",
@@ -416,7 +608,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             tool_calls: Optional tool calls.
         
         Returns:
-            Updated message list.
+            The same list, appended to in place.
         """
         msg: dict[str, Any] = {"role": "assistant", "content": content or ""}
         
@@ -1,16 +1,16 @@
 """Agent loop: the core processing engine."""
 
 import asyncio
-import json
 import re
+import time
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 from loguru import logger
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
-from nanobot.providers.base import LLMProvider
+from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
 from nanobot.agent.context import ContextBuilder
 from nanobot.agent.compaction import ContextGuard, create_context_guard
 from nanobot.agent.tools.registry import ToolRegistry
@@ -21,7 +21,8 @@ from nanobot.agent.tools.message import MessageTool
 from nanobot.agent.tools.spawn import SpawnTool
 from nanobot.agent.tools.process import ProcessTool
 from nanobot.agent.subagent import SubagentManager
-from nanobot.session.manager import SessionManager
+from nanobot.agent.swarm_trigger import should_use_swarm
+from nanobot.session.manager import Session, SessionManager
 
 if TYPE_CHECKING:
     from nanobot.config.schema import Config
@@ -37,6 +38,27 @@ if TYPE_CHECKING:
     from nanobot.tracking.optimizer import CostOptimizer
 
 
+# Indicators for UI-related tasks, matched against the lowercased message.
+# All keywords share one word-boundary group: a single alternation with
+# IGNORECASE scans far slower than this on lowercased text.
+_UI_TASK_RE = re.compile(
+    r"\b(?:"
+    r"ui|ux|frontend|css|style|layout|design"
+    r"|component|button|form|input|modal|dialog"
+    r"|page|screen|view|interface"
+    r"|html|jsx|tsx|react|vue|angular|svelte"
+    r"|responsive|mobile|desktop|tablet"
+    r"|color|font|animation|transition"
+    r"|navbar|sidebar|footer|header"
+    r")\b"
+    r"|localhost:\d+"
+    r"|http://.*:\d+"
+)
+
+# Sampling temperature for each thinking level
+_THINKING_TEMPS = {"low": 0.9, "medium": 0.7, "high": 0.3}
+
+
 class AgentLoop:
     """
     The agent loop is the core processing engine.
@@ -50,6 +72,12 @@ class AgentLoop:
     6. Optionally triggers swarm for complex tasks
     """
     
+    ERROR_REPLY = "Sorry, I encountered an error: {}"
+    ERROR_REPLY_INTERVAL = 30.0  # Seconds before repeating an identical error to a chat
+    PENDING_RESULT = "[PENDING: this result is still being computed]"  # Speculative decode stand-in
+    SKIPPED_TOOL_RESULT = "Error: {} was skipped because it keeps failing with this model; use another tool or approach"
+    UNVIABLE_TOOLS_REPLY = "Sorry, I couldn't complete this: the tools I need ({}) keep failing with the current model."
+    
     def __init__(
         self,
         bus: MessageBus,
@@ -61,22 +89,30 @@ class AgentLoop:
         brave_api_key: str | None = None,
         enable_context_guard: bool = True,
         context_threshold: float = 0.8,
+        speculative_decode: bool = False,
     ):
         self.bus = bus
         self.provider = provider
         self.workspace = workspace
+        self._workspace_str = str(workspace)  # Working dir for shell/process tools
         self.config = config
         self.default_model = model or provider.get_default_model()
         self.model = self.default_model  # Keep for backward compatibility
         self.max_iterations = max_iterations
         self.brave_api_key = brave_api_key
+        self.speculative_decode = speculative_decode
+        
+        # Resolve the agent settings once; every subsystem below reads from them
+        agents = config.agents if config else None
+        memory_config = getattr(agents, 'memory', None)
+        compaction_config = getattr(agents, 'compaction', None)
         
         # Initialize context builder with memory settings
         enable_vector_search = False
         context_memories = 5
-        if config and hasattr(config.agents, 'memory'):
-            enable_vector_search = config.agents.memory.vector_search
-            context_memories = config.agents.memory.context_memories
+        if memory_config is not None:
+            enable_vector_search = memory_config.vector_search
+            context_memories = memory_config.context_memories
         
         self.context = ContextBuilder(
             workspace=workspace,
@@ -97,33 +133,43 @@ class AgentLoop:
         self.context_guard: ContextGuard | None = None
         if enable_context_guard:
             # Enable memory-aware compaction if memory is enabled
-            save_to_memory = False
-            if config and hasattr(config.agents, 'memory'):
-                save_to_memory = config.agents.memory.enabled
+            save_to_memory = memory_config is not None and memory_config.enabled
+            
+            rubric_gate = False
+            probe_interval = 3
+            strategy = "always_on"
+            if compaction_config is not None:
+                rubric_gate = compaction_config.rubric_gate
+                probe_interval = compaction_config.probe_interval
+                strategy = compaction_config.strategy
             
             self.context_guard = create_context_guard(
                 model=self.default_model,
                 threshold=context_threshold,
                 save_to_memory=save_to_memory,
                 memory_callback=self._save_summary_to_memory if save_to_memory else None,
+                rubric_gate=rubric_gate,
+                probe_interval=probe_interval,
+                summary_cache_path=workspace / ".cache" / "summaries.json",
+                strategy=strategy,
             )
         
         # Tiered routing (if enabled in config)
         self.router: "TieredRouter | None" = None
-        if config and config.agents.tiered_routing.enabled:
+        if agents and agents.tiered_routing.enabled:
             from nanobot.routing.router import create_router_from_config
             self.router = create_router_from_config(config)
             logger.info(f"Tiered routing enabled with {len(self.router.tiers)} tiers")
         
         # Swarm orchestrator (if enabled in config)
         self.swarm_orchestrator: "SwarmOrchestrator | None" = None
-        if config and config.agents.swarm.enabled:
+        if agents and agents.swarm.enabled:
             from nanobot.swarm.orchestrator import SwarmOrchestrator, SwarmConfig
             swarm_config = SwarmConfig(
                 enabled=True,
-                max_workers=config.agents.swarm.max_workers,
-                worker_model=config.agents.swarm.worker_model,
-                orchestrator_model=config.agents.swarm.orchestrator_model,
+                max_workers=agents.swarm.max_workers,
+                worker_model=agents.swarm.worker_model,
+                orchestrator_model=agents.swarm.orchestrator_model,
             )
             self.swarm_orchestrator = SwarmOrchestrator(
                 config=swarm_config,
@@ -135,37 +181,38 @@ class AgentLoop:
         # Visual validator (if dev workflow enabled)
         self.visual_validator: "VisualValidator | None" = None
         self.process_tool: ProcessTool | None = None
-        if config and config.agents.dev_workflow.enabled:
-            self.process_tool = ProcessTool(working_dir=str(workspace))
+        if agents and agents.dev_workflow.enabled:
+            self.process_tool = ProcessTool(working_dir=self._workspace_str)
             
-            if config.agents.dev_workflow.visual_validation.enabled:
+            if agents.dev_workflow.visual_validation.enabled:
                 # Lazy initialization - will be created when browser tool is available
                 logger.info("Visual validation enabled (will initialize when browser available)")
         
         # Model Profiler registry (for profile-aware model selection)
         self.model_registry: "ModelRegistry | None" = None
         self.model_interviewer: "ModelInterviewer | None" = None
-        if config and config.agents.profiler.enabled:
+        profiler_config = agents.profiler if agents else None
+        if profiler_config and profiler_config.enabled:
             from nanobot.profiler.registry import ModelRegistry
             from nanobot.profiler.interviewer import ModelInterviewer
             
-            storage_path = Path(config.agents.profiler.storage_path).expanduser()
+            storage_path = Path(profiler_config.storage_path).expanduser()
             self.model_registry = ModelRegistry(storage_path=storage_path)
             self.model_interviewer = ModelInterviewer(
                 provider=provider,
-                interviewer_model=config.agents.profiler.interviewer_model,
+                interviewer_model=profiler_config.interviewer_model,
                 workspace=workspace,
             )
             logger.info(f"Model profiler enabled, {len(self.model_registry.list_profiles())} profiles loaded")
         
         # Team orchestrator (persona-based hierarchy)
         self.team_orchestrator: "TeamOrchestrator | None" = None
-        if config and config.agents.team.enabled:
+        if agents and agents.team.enabled:
             from nanobot.swarm.orchestrator import TeamOrchestrator
             self.team_orchestrator = TeamOrchestrator(
                 provider=provider,
                 workspace=workspace,
-                config=config.agents.team,
+                config=agents.team,
                 model_registry=self.model_registry,  # Pass registry for profile-aware assignment
             )
             logger.info("Team orchestrator enabled with persona-based hierarchy")
@@ -173,27 +220,30 @@ class AgentLoop:
         # Tool call manager (self-heal controls)
         self.tool_manager: "ToolCallManager | None" = None
         self.tool_advisor: "ToolAdvisor | None" = None
-        if config and hasattr(config.agents, 'self_heal') and config.agents.self_heal.enabled:
+        self_heal = getattr(agents, 'self_heal', None)
+        if self_heal is not None and self_heal.enabled:
             from nanobot.agent.tool_manager import ToolCallManager, RetryConfig, CircuitBreakerConfig
             from nanobot.agent.tool_advisor import ToolAdvisor, AdvisorConfig
             
+            reinforcement = agents.tool_reinforcement
+            
             # Build retry config from settings
             retry_config = RetryConfig(
-                max_retries=config.agents.self_heal.max_tool_retries,
-                base_delay=config.agents.self_heal.retry_base_delay,
-                max_delay=config.agents.self_heal.retry_max_delay,
-                exponential_base=config.agents.self_heal.retry_exponential_base,
+                max_retries=self_heal.max_tool_retries,
+                base_delay=self_heal.retry_base_delay,
+                max_delay=self_heal.retry_max_delay,
+                exponential_base=self_heal.retry_exponential_base,
             )
             
             # Build circuit breaker config
             circuit_config = CircuitBreakerConfig(
-                failure_threshold=config.agents.self_heal.circuit_breaker_threshold,
-                reset_timeout=float(config.agents.self_heal.circuit_breaker_cooldown),
+                failure_threshold=self_heal.circuit_breaker_threshold,
+                reset_timeout=float(self_heal.circuit_breaker_cooldown),
             )
             
             # Build tool policy if security is configured
             tool_policy = None
-            if config.agents.tool_reinforcement.enforce_security_policy:
+            if reinforcement.enforce_security_policy:
                 from nanobot.security.policy import create_policy_from_config
                 tool_policy = create_policy_from_config({
                     "allow": config.security.tool_policy.allow,
@@ -207,19 +257,22 @@ class AgentLoop:
                 retry_config=retry_config,
                 circuit_config=circuit_config,
                 tool_policy=tool_policy,
-                enable_validation=config.agents.tool_reinforcement.pre_validation,
+                enable_validation=reinforcement.pre_validation,
             )
             logger.info("Tool call manager enabled with retry and circuit breaker")
             
             # Initialize tool advisor if adaptive selection enabled
-            if config.agents.tool_reinforcement.adaptive_selection:
+            if reinforcement.adaptive_selection:
                 advisor_config = AdvisorConfig(
-                    min_calls_for_confidence=config.agents.tool_reinforcement.min_calls_for_confidence,
-                    default_confidence=config.agents.tool_reinforcement.default_confidence,
-                    error_warning_threshold=config.agents.tool_reinforcement.error_warning_threshold,
-                    suggest_alternative_threshold=config.agents.tool_reinforcement.suggest_alternative_threshold,
+                    min_calls_for_confidence=reinforcement.min_calls_for_confidence,
+                    default_confidence=reinforcement.default_confidence,
+                    error_warning_threshold=reinforcement.error_warning_threshold,
+                    suggest_alternative_threshold=reinforcement.suggest_alternative_threshold,
+                    block_min_calls=reinforcement.block_min_calls,
+                    block_max_success_rate=reinforcement.block_max_success_rate,
+                    block_retry_seconds=reinforcement.block_retry_seconds,
                 )
-                advisor_path = Path(config.agents.tool_reinforcement.advisor_storage_path).expanduser()
+                advisor_path = Path(reinforcement.advisor_storage_path).expanduser()
                 self.tool_advisor = ToolAdvisor(
                     storage_path=advisor_path,
                     config=advisor_config,
@@ -229,25 +282,26 @@ class AgentLoop:
         # Intent tracker (proactive AI)
         self.intent_tracker: "IntentTracker | None" = None
         self.current_intent: "UserIntent | None" = None
-        if config and hasattr(config.agents, 'intent_tracking') and config.agents.intent_tracking.enabled:
+        self._intent_tasks: set[asyncio.Task] = set()  # Background intent captures in flight
+        intent_config = getattr(agents, 'intent_tracking', None)
+        if intent_config is not None and intent_config.enabled:
             from nanobot.intent.tracker import IntentTracker
             self.intent_tracker = IntentTracker(
                 workspace=workspace,
                 provider=provider,
-                model=config.agents.intent_tracking.analysis_model,
+                model=intent_config.analysis_model,
             )
             logger.info("Intent tracker enabled for proactive AI")
         
         # Response cache and cost optimizer (Phase 5B)
         self.response_cache: "ResponseCache | None" = None
         self.cost_optimizer: "CostOptimizer | None" = None
-        if config and hasattr(config.agents, 'cost_optimization') and config.agents.cost_optimization.enabled:
+        cost_config = getattr(agents, 'cost_optimization', None)
+        if cost_config is not None and cost_config.enabled:
             from nanobot.tracking.cache import ResponseCache
             from nanobot.tracking.optimizer import CostOptimizer
             from nanobot.tracking.tokens import TokenTracker
             
-            cost_config = config.agents.cost_optimization
-            
             if cost_config.response_caching:
                 cache_path = Path(cost_config.cache_storage_path).expanduser()
                 self.response_cache = ResponseCache(
@@ -276,7 +330,18 @@ class AgentLoop:
             logger.info("Cost optimizer enabled")
         
         self._running = False
-        self._auto_interview_pending: set[str] = set()  # Models pending interview
+        self._run_task: asyncio.Task | None = None
+        self._waiting = False  # True while run() is idle on the bus
+        self._save_tasks: dict[str, asyncio.Task] = {}  # Latest pending save per session
+        self._save_queued: set[str] = set()  # Sessions with a save not yet started
+        self._last_error_reply: dict[str, tuple[str, float]] = {}  # session -> (content, time)
+        self._auto_interview_tasks: dict[str, asyncio.Task] = {}  # In-flight interviews by model
+        self._advisor_short_circuits = 0  # Turns ended because every tool call was unviable
+        self._stats_queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+        self._stats_task: asyncio.Task | None = None
+        self._auto_interview = bool(
+            self.model_interviewer and config and config.agents.profiler.auto_interview
+        )
         self._register_default_tools()
     
     def _register_default_tools(self) -> None:
@@ -288,7 +353,7 @@ class AgentLoop:
         self.tools.register(ListDirTool())
         
         # Shell tool
-        self.tools.register(ExecTool(working_dir=str(self.workspace)))
+        self.tools.register(ExecTool(working_dir=self._workspace_str))
         
         # Web tools
         self.tools.register(WebSearchTool(api_key=self.brave_api_key))
@@ -297,17 +362,19 @@ class AgentLoop:
         # Message tool
         message_tool = MessageTool(send_callback=self.bus.publish_outbound)
         self.tools.register(message_tool)
+        self._message_tool = message_tool  # Kept for per-message context updates
         
         # Spawn tool (for subagents)
         spawn_tool = SpawnTool(manager=self.subagents)
         self.tools.register(spawn_tool)
+        self._spawn_tool = spawn_tool
         
         # Process tool for dev server management
         if self.process_tool:
             self.tools.register(self.process_tool)
         else:
             # Register a default process tool
-            self.tools.register(ProcessTool(working_dir=str(self.workspace)))
+            self.tools.register(ProcessTool(working_dir=self._workspace_str))
         
         # Swarm tool (if orchestrator available)
         if self.swarm_orchestrator:
@@ -330,35 +397,169 @@ class AgentLoop:
         self._running = True
         logger.info("Agent loop started")
         
+        self._run_task = asyncio.current_task()
         while self._running:
+            # Block on the bus until a message arrives; stop() cancels the wait
+            self._waiting = True
             try:
-                # Wait for next message
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
-                )
-                
-                # Process it
-                try:
-                    response = await self._process_message(msg)
-                    if response:
-                        await self.bus.publish_outbound(response)
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    # Send error response
+                msg = await self.bus.consume_inbound()
+            except asyncio.CancelledError:
+                if self._running:
+                    raise
+                self._run_task.uncancel()
+                break
+            finally:
+                self._waiting = False
+            
+            # Process it
+            try:
+                response = await self._process_message(msg)
+                if response:
+                    await self.bus.publish_outbound(response)
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                # Send error response (unless the chat just got the same one)
+                content = self.ERROR_REPLY.format(e)
+                if self._should_send_error(msg.session_key, content):
                     await self.bus.publish_outbound(OutboundMessage(
                         channel=msg.channel,
                         chat_id=msg.chat_id,
-                        content=f"Sorry, I encountered an error: {str(e)}"
+                        content=content
                     ))
-            except asyncio.TimeoutError:
-                continue
+    
+    def _should_send_error(self, session_key: str, content: str) -> bool:
+        """
+        Rate-limit identical error replies per chat.
+        
+        A stuck upstream fails every message the same way; repeating the
+        error once per ERROR_REPLY_INTERVAL is enough to inform the user
+        without flooding the outbound bus.
+        """
+        now = time.monotonic()
+        last = self._last_error_reply.get(session_key)
+        if last and last[0] == content and now - last[1] < self.ERROR_REPLY_INTERVAL:
+            logger.debug(f"Suppressed repeated error reply to {session_key}")
+            return False
+        self._last_error_reply[session_key] = (content, now)
+        return True
     
     def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
+        if self._waiting and self._run_task:
+            self._run_task.cancel()
+        # Call flush_stats() first; updates queued later are applied by the next flush
+        if self._stats_task:
+            self._stats_task.cancel()
+            self._stats_task = None
+        if self.tool_advisor:
+            self.tool_advisor.close()
+        # Intent captures are advisory; cleanup() awaits them instead when it runs first
+        for task in self._intent_tasks:
+            task.cancel()
         logger.info("Agent loop stopping")
     
+    def _save_session(self, session: Session) -> None:
+        """
+        Persist a session in the background, off the reply's critical path.
+        
+        Saves of the same session are chained so they land on disk in order,
+        and a save requested while another is still queued is dropped: the
+        queued write serializes the session as it is when it starts.
+        """
+        if session.key in self._save_queued:
+            return
+        self._save_queued.add(session.key)
+        previous = self._save_tasks.get(session.key)
+        task = asyncio.create_task(self._write_session(session, previous))
+        self._save_tasks[session.key] = task
+        task.add_done_callback(
+            lambda t, key=session.key: self._save_tasks.pop(key, None) if self._save_tasks.get(key) is t else None
+        )
+    
+    async def _write_session(self, session: Session, previous: asyncio.Task | None) -> None:
+        """
+        Write a session to disk once the previous save of it has finished.
+        
+        The session is serialized here on the loop, where it is mutated, so
+        the executor only writes an immutable snapshot.
+        """
+        if previous:
+            await asyncio.gather(previous, return_exceptions=True)
+        self._save_queued.discard(session.key)
+        try:
+            text = self.sessions.serialize(session)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.sessions.write, session.key, text
+            )
+        except Exception as e:
+            logger.error(f"Failed to save session {session.key}: {e}")
+    
+    async def flush_sessions(self) -> None:
+        """Wait for pending background session saves to finish."""
+        while self._save_tasks:
+            await asyncio.gather(*self._save_tasks.values(), return_exceptions=True)
+    
+    def _record_stats(self, kind: str, **fields: Any) -> None:
+        """
+        Queue a model registry ("registry") or tool advisor ("advisor") update.
+        
+        Both subsystems periodically write their stats to disk; the stats
+        worker applies queued updates in batches between agent iterations.
+        """
+        self._start_stats_worker()
+        self._stats_queue.put_nowait((kind, fields))
+    
+    def _start_stats_worker(self) -> None:
+        """
+        Start the stats worker unless it is already running.
+        
+        Called before an update is queued, so an eager task factory runs a
+        new worker only up to its first (empty) queue wait.
+        """
+        if self._stats_task is None or self._stats_task.done():
+            self._stats_task = asyncio.create_task(self._stats_worker())
+    
+    async def _stats_worker(self) -> None:
+        """Apply queued stats updates, draining everything pending per wake-up."""
+        queue = self._stats_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            await self._apply_stats(batch)
+    
+    async def _apply_stats(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        """Apply a batch of queued stats updates and mark them done."""
+        failed: dict[str, None] = {}
+        for kind, fields in batch:
+            try:
+                if kind == "registry":
+                    await self.model_registry.update_runtime_stats_async(**fields)
+                    if not fields["success"]:
+                        failed[fields["model_id"]] = None
+                elif kind == "advisor":
+                    self.tool_advisor.record_tool_call(**fields)
+            except Exception as e:
+                logger.warning(f"Failed to record {kind} stats: {e}")
+            finally:
+                self._stats_queue.task_done()
+        
+        # Check for high failure rate and trigger re-assessment
+        for model_id in failed:
+            asyncio.create_task(self._quick_assess_on_failure(model_id))
+    
+    async def flush_stats(self) -> None:
+        """Wait for queued stats updates to be applied."""
+        if self._stats_task and not self._stats_task.done():
+            await self._stats_queue.join()
+            return
+        # No worker (stopped or never started): apply what is pending here
+        batch = []
+        while not self._stats_queue.empty():
+            batch.append(self._stats_queue.get_nowait())
+        await self._apply_stats(batch)
+    
     async def _process_message(
         self, 
         msg: InboundMessage,
@@ -383,46 +584,19 @@ class AgentLoop:
         
         logger.info(f"Processing message from {msg.channel}:{msg.sender_id}")
         
-        # Get or create session
-        session = self.sessions.get_or_create(msg.session_key)
-        
-        # Capture intent (proactive AI - non-blocking)
-        if self.intent_tracker:
-            try:
-                self.current_intent = await self.intent_tracker.capture_intent(
-                    message=msg.content,
-                    session_id=msg.session_key,
-                    user_id=msg.sender_id or "default",
-                )
-                logger.debug(
-                    f"Intent captured: {self.current_intent.category} - "
-                    f"{self.current_intent.inferred_goal[:50]}..."
-                )
-            except Exception as e:
-                logger.warning(f"Intent capture failed: {e}")
-                self.current_intent = None
+        # Get or create session (session_key is built per access; read it once)
+        session_key = msg.session_key
+        session = self.sessions.get_or_create(session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(msg.channel, msg.chat_id)
-        
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(msg.channel, msg.chat_id)
+        self._message_tool.set_context(msg.channel, msg.chat_id)
+        self._spawn_tool.set_context(msg.channel, msg.chat_id)
         
         # Check for team commands (/reach and /done)
         if self.team_orchestrator:
             team_result = await self._handle_team_commands(msg)
             if team_result:
-                session.add_message("user", msg.content)
-                session.add_message("assistant", team_result)
-                self.sessions.save(session)
-                return OutboundMessage(
-                    channel=msg.channel,
-                    chat_id=msg.chat_id,
-                    content=team_result
-                )
+                return self._finish_turn(msg, session, team_result)
         
         # Determine model via tiered routing (if enabled) or use override
         model_to_use = self.default_model
@@ -440,14 +614,36 @@ class AgentLoop:
                 f"Tier: {routing_decision.tier} -> Model: {model_to_use}"
             )
         
+        # Check cache as soon as the model is known; hits skip all further work.
+        # The should_cache verdict is reused when storing the reply below.
+        cacheable = False
+        if self.response_cache is not None and self.cost_optimizer is not None:
+            task_type = routing_decision.classification.task_type.value if routing_decision else ""
+            cacheable = self.cost_optimizer.should_cache(msg.content, task_type)
+            if cacheable:
+                cached_response = self.response_cache.get(msg.content, model_to_use)
+                if cached_response:
+                    logger.info(f"Cache hit for query (saved tokens)")
+                    # Return cached response directly
+                    return self._finish_turn(msg, session, cached_response)
+        
+        # Capture intent (proactive AI - runs alongside the agent loop)
+        if self.intent_tracker:
+            task = asyncio.create_task(self._capture_intent(msg))
+            self._intent_tasks.add(task)
+            task.add_done_callback(self._intent_tasks.discard)
+        
         # Check if model needs profiling (auto-interview)
-        if self.model_registry and not self.model_registry.get_profile(model_to_use):
-            # Schedule background auto-interview (non-blocking)
-            asyncio.create_task(self._auto_interview_model(model_to_use))
+        if (
+            self._auto_interview
+            and model_to_use not in self._auto_interview_tasks
+            and not self.model_registry.get_profile(model_to_use)
+        ):
+            # Schedule background auto-interview (non-blocking), once per model
+            self._schedule_auto_interview(model_to_use)
         
         # Check if swarm should be used for complex tasks
         if self.swarm_orchestrator and routing_decision:
-            from nanobot.agent.swarm_trigger import should_use_swarm, auto_select_pattern
             should_swarm, pattern = should_use_swarm(
                 msg.content, 
                 routing_decision.classification,
@@ -460,168 +656,56 @@ class AgentLoop:
                     pattern=pattern,
                 )
                 # Use swarm result as the final content
-                session.add_message("user", msg.content)
-                session.add_message("assistant", swarm_result)
-                self.sessions.save(session)
-                return OutboundMessage(
-                    channel=msg.channel,
-                    chat_id=msg.chat_id,
-                    content=swarm_result
-                )
+                return self._finish_turn(msg, session, swarm_result)
         
         # Build initial messages (use get_history for LLM-formatted messages)
-        messages = self.context.build_messages(
+        messages = await self.context.abuild_messages(
             history=session.get_history(),
             current_message=msg.content
         )
         
-        # Agent loop
-        iteration = 0
-        final_content = None
-        cache_hit = False
-        
-        # Check cache before starting iteration (for simple text-only queries)
-        if self.response_cache and self.cost_optimizer:
-            task_type = routing_decision.classification.task_type.value if routing_decision else ""
-            if self.cost_optimizer.should_cache(msg.content, task_type):
-                cached_response = self.response_cache.get(msg.content, model_to_use)
-                if cached_response:
-                    logger.info(f"Cache hit for query (saved tokens)")
-                    cache_hit = True
-                    # Return cached response directly
-                    session.add_message("user", msg.content)
-                    session.add_message("assistant", cached_response)
-                    self.sessions.save(session)
-                    return OutboundMessage(
-                        channel=msg.channel,
-                        chat_id=msg.chat_id,
-                        content=cached_response
-                    )
-        
         # Map thinking level to temperature
-        thinking_temps = {"low": 0.9, "medium": 0.7, "high": 0.3}
-        temperature = thinking_temps.get(thinking_level, 0.7)
-        
-        while iteration < self.max_iterations:
-            iteration += 1
-            
-            # Apply context compaction if needed (with memory-aware saving)
-            if self.context_guard:
-                messages = await self.context_guard.compact_if_needed(
-                    messages, self.provider, session_id=msg.session_key
-                )
-            
-            # Call LLM with routed model and thinking-adjusted temperature
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=model_to_use,
-                temperature=temperature,
-            )
-            
-            # Track model health for routing
-            success = bool(response.content)
-            if self.router:
-                if success:
-                    self.router.mark_model_success(model_to_use)
-                else:
-                    self.router.mark_model_failed(model_to_use)
-            
-            # Update runtime stats in model registry
-            if self.model_registry:
-                tool_success = None
-                if response.has_tool_calls:
-                    # We'll track tool success as None here since we haven't executed yet
-                    tool_success = True  # Optimistic; will be corrected if tools fail
-                self.model_registry.update_runtime_stats(
-                    model_id=model_to_use,
-                    success=success,
-                    tool_success=tool_success,
-                )
-                
-                # Check for high failure rate and trigger re-assessment
-                if not success:
-                    asyncio.create_task(self._quick_assess_on_failure(model_to_use))
-            
-            # Handle tool calls
-            if response.has_tool_calls:
-                # Add assistant message with tool calls
-                tool_call_dicts = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)  # Must be JSON string
-                        }
-                    }
-                    for tc in response.tool_calls
-                ]
-                messages = self.context.add_assistant_message(
-                    messages, response.content, tool_call_dicts
-                )
-                
-                # Execute tools (with retry/circuit breaker if tool_manager available)
-                for tool_call in response.tool_calls:
-                    logger.debug(f"Executing tool: {tool_call.name}")
-                    
-                    tool_success = True
-                    start_time = asyncio.get_event_loop().time()
-                    
-                    if self.tool_manager:
-                        # Use tool manager with retry and circuit breaker
-                        exec_result = await self.tool_manager.execute_with_retry(
-                            tool_name=tool_call.name,
-                            arguments=tool_call.arguments,
-                            model_profile=self.model_registry.get_profile(model_to_use) if self.model_registry else None,
-                            call_id=tool_call.id,
-                        )
-                        result = exec_result.result
-                        tool_success = exec_result.success
-                    else:
-                        # Direct execution (fallback)
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                        tool_success = not result.startswith("Error:")
-                    
-                    # Track tool usage in advisor
-                    if self.tool_advisor:
-                        latency_ms = (asyncio.get_event_loop().time() - start_time) * 1000
-                        self.tool_advisor.record_tool_call(
-                            model_id=model_to_use,
-                            tool_name=tool_call.name,
-                            success=tool_success,
-                            latency_ms=latency_ms,
-                            error=result if not tool_success else "",
-                        )
-                    
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
-            else:
-                # No tool calls, we're done
-                final_content = response.content
-                break
+        temperature = _THINKING_TEMPS.get(thinking_level, 0.7)
+        
+        final_content, _, answered_directly = await self._run_llm_loop(
+            messages,
+            model_to_use,
+            lambda tc: self._execute_tool_call(tc, model_to_use),
+            temperature=temperature,
+            session_id=session_key,
+        )
         
         if final_content is None:
             final_content = "I've completed processing but have no response to give."
         
         # Cache response if it was a simple single-turn response (no tools used)
-        if self.response_cache and self.cost_optimizer and iteration == 1:
-            task_type = routing_decision.classification.task_type.value if routing_decision else ""
-            if self.cost_optimizer.should_cache(msg.content, task_type):
-                self.response_cache.set(msg.content, final_content, model_to_use)
-                logger.debug(f"Cached response for query")
-        
-        # Save to session
-        session.add_message("user", msg.content)
-        session.add_message("assistant", final_content)
-        self.sessions.save(session)
+        if cacheable and answered_directly:
+            self.response_cache.set(msg.content, final_content, model_to_use)
+            logger.debug(f"Cached response for query")
         
-        return OutboundMessage(
-            channel=msg.channel,
-            chat_id=msg.chat_id,
-            content=final_content
-        )
+        return self._finish_turn(msg, session, final_content)
+    
+    def _finish_turn(self, msg: InboundMessage, session: Session, content: str) -> OutboundMessage:
+        """Record a completed user/assistant turn, schedule its save, and build the reply."""
+        session.add_turn(msg.content, content)
+        self._save_session(session)
+        return OutboundMessage(channel=msg.channel, chat_id=msg.chat_id, content=content)
+    
+    async def _capture_intent(self, msg: InboundMessage) -> None:
+        """Capture the intent behind a user message into current_intent."""
+        try:
+            self.current_intent = await self.intent_tracker.capture_intent(
+                message=msg.content,
+                session_id=msg.session_key,
+                user_id=msg.sender_id or "default",
+            )
+            logger.debug(
+                f"Intent captured: {self.current_intent.category} - "
+                f"{self.current_intent.inferred_goal[:50]}..."
+            )
+        except Exception as e:
+            logger.warning(f"Intent capture failed: {e}")
+            self.current_intent = None
     
     async def _process_system_message(self, msg: InboundMessage) -> OutboundMessage | None:
         """
@@ -633,11 +717,8 @@ class AgentLoop:
         logger.info(f"Processing system message from {msg.sender_id}")
         
         # Parse origin from chat_id (format: "channel:chat_id")
-        if ":" in msg.chat_id:
-            parts = msg.chat_id.split(":", 1)
-            origin_channel = parts[0]
-            origin_chat_id = parts[1]
-        else:
+        origin_channel, sep, origin_chat_id = msg.chat_id.partition(":")
+        if not sep:
             # Fallback
             origin_channel = "cli"
             origin_chat_id = msg.chat_id
@@ -647,13 +728,8 @@ class AgentLoop:
         session = self.sessions.get_or_create(session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(origin_channel, origin_chat_id)
-        
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(origin_channel, origin_chat_id)
+        self._message_tool.set_context(origin_channel, origin_chat_id)
+        self._spawn_tool.set_context(origin_channel, origin_chat_id)
         
         # Determine model via tiered routing (if enabled)
         model_to_use = self.default_model
@@ -663,62 +739,25 @@ class AgentLoop:
             logger.debug(f"System message routed to: {model_to_use}")
         
         # Build messages with the announce content
-        messages = self.context.build_messages(
+        messages = await self.context.abuild_messages(
             history=session.get_history(),
             current_message=msg.content
         )
         
         # Agent loop (limited for announce handling)
-        iteration = 0
-        final_content = None
-        
-        while iteration < self.max_iterations:
-            iteration += 1
-            
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=model_to_use
-            )
-            
-            # Track model health
-            if self.router:
-                if response.content:
-                    self.router.mark_model_success(model_to_use)
-            
-            if response.has_tool_calls:
-                tool_call_dicts = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)
-                        }
-                    }
-                    for tc in response.tool_calls
-                ]
-                messages = self.context.add_assistant_message(
-                    messages, response.content, tool_call_dicts
-                )
-                
-                for tool_call in response.tool_calls:
-                    logger.debug(f"Executing tool: {tool_call.name}")
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
-            else:
-                final_content = response.content
-                break
+        final_content, _, _ = await self._run_llm_loop(
+            messages,
+            model_to_use,
+            lambda tc: self.tools.execute(tc.name, tc.arguments),
+            track_failures=False,
+        )
         
         if final_content is None:
             final_content = "Background task completed."
         
         # Save to session (mark as system message in history)
-        session.add_message("user", f"[System: {msg.sender_id}] {msg.content}")
-        session.add_message("assistant", final_content)
-        self.sessions.save(session)
+        session.add_turn(f"[System: {msg.sender_id}] {msg.content}", final_content)
+        self._save_session(session)
         
         return OutboundMessage(
             channel=origin_channel,
@@ -726,6 +765,253 @@ class AgentLoop:
             content=final_content
         )
     
+    async def _run_llm_loop(
+        self,
+        messages: list[dict[str, Any]],
+        model_to_use: str,
+        execute: Callable[[ToolCallRequest], Awaitable[str]],
+        temperature: float = 0.7,
+        session_id: str | None = None,
+        track_failures: bool = True,
+    ) -> tuple[str | None, int, bool]:
+        """
+        Call the LLM and execute its tool calls until it answers in text.
+        
+        Shared by user and system message handling.
+        
+        Args:
+            messages: Initial message list for the LLM.
+            model_to_use: Model for every call.
+            execute: Coroutine function executing a single tool call.
+            temperature: Sampling temperature.
+            session_id: Session key for context compaction (None skips compaction).
+            track_failures: Report failures and runtime stats to the router and
+                model registry, not just successes.
+        
+        Returns:
+            Tuple of (final content, or None if iterations ran out; iterations
+            used; whether the content is the model's answer to its first call
+            with no tools involved, i.e. safe to cache).
+        """
+        # Bound once; these are read on every iteration
+        provider, tools, context = self.provider, self.tools, self.context
+        context_guard = self.context_guard if session_id is not None else None
+        router, model_registry, tool_advisor = self.router, self.model_registry, self.tool_advisor
+        chat, get_definitions = provider.chat, tools.get_definitions
+        add_assistant_message, add_tool_result = context.add_assistant_message, context.add_tool_result
+        
+        speculative_decode = self.speculative_decode
+        next_response: LLMResponse | None = None  # Kept from a speculative call
+        
+        for iteration in range(1, self.max_iterations + 1):
+            # Apply context compaction if needed (with memory-aware saving),
+            # also before acting on a kept speculative response
+            if context_guard:
+                messages = await context_guard.compact_if_needed(
+                    messages, provider, session_id=session_id
+                )
+            
+            if next_response is not None:
+                response, next_response = next_response, None
+            else:
+                # Call LLM with routed model and thinking-adjusted temperature
+                response = await chat(
+                    messages=messages,
+                    tools=get_definitions(),
+                    model=model_to_use,
+                    temperature=temperature,
+                )
+            
+            # Track model health for routing
+            success = bool(response.content)
+            if router:
+                if success:
+                    router.mark_model_success(model_to_use)
+                elif track_failures:
+                    router.mark_model_failed(model_to_use)
+            
+            # Update runtime stats in model registry
+            if model_registry and track_failures:
+                tool_success = None
+                if response.has_tool_calls:
+                    # We'll track tool success as None here since we haven't executed yet
+                    tool_success = True  # Optimistic; will be corrected if tools fail
+                # Applied by the stats worker, which also triggers re-assessment on failure
+                self._record_stats(
+                    "registry",
+                    model_id=model_to_use,
+                    success=success,
+                    tool_success=tool_success,
+                )
+            
+            if not response.has_tool_calls:
+                return response.content, iteration, iteration == 1
+            
+            # Skip the round-trip when every call is a known-broken combination;
+            # partly viable rounds skip the broken calls in _execute_tool_call
+            if tool_advisor and not any(
+                tool_advisor.is_viable(model_to_use, tc.name) for tc in response.tool_calls
+            ):
+                names = ", ".join(dict.fromkeys(tc.name for tc in response.tool_calls))
+                self._advisor_short_circuits += 1
+                logger.warning(f"Tool advisor short-circuit: {names} unviable for {model_to_use}")
+                return self.UNVIABLE_TOOLS_REPLY.format(names), iteration, False
+            
+            # Add assistant message with tool calls (appended in place)
+            tool_call_dicts = [tc.to_message_dict() for tc in response.tool_calls]
+            add_assistant_message(messages, response.content, tool_call_dicts)
+            
+            # Execute tools, then record results in the order they were emitted
+            if speculative_decode and self._is_read_only(response.tool_calls):
+                results, next_response = await self._execute_speculatively(
+                    messages, response.tool_calls, execute, model_to_use, temperature
+                )
+            else:
+                results = await tools.execute_calls(response.tool_calls, execute)
+            for tool_call, result in zip(response.tool_calls, results):
+                add_tool_result(messages, tool_call.id, tool_call.name, result)
+        
+        return None, self.max_iterations, False
+    
+    def _is_read_only(self, tool_calls: list[ToolCallRequest]) -> bool:
+        """Check that none of the tool calls can change state."""
+        is_mutating = self.tools.is_mutating
+        return not any(is_mutating(tc.name) for tc in tool_calls)
+    
+    async def _execute_speculatively(
+        self,
+        messages: list[dict[str, Any]],
+        tool_calls: list[ToolCallRequest],
+        execute: Callable[[ToolCallRequest], Awaitable[str]],
+        model_to_use: str,
+        temperature: float,
+    ) -> tuple[list[str], LLMResponse | None]:
+        """
+        Run read-only tool calls while the model decodes its next step.
+        
+        The next chat call is issued alongside the tools with PENDING_RESULT
+        standing in for every result. If the tools finish first, the
+        speculative call is cancelled. If the model answers first, its
+        response is kept only when it is a further round of read-only tool
+        calls that does not depend on the pending results; anything else
+        (a final answer, a state change) has to see the real results.
+        
+        Args:
+            messages: Messages ending with the assistant's tool-call message.
+            tool_calls: The read-only tool calls to execute.
+            execute: Coroutine function executing a single tool call.
+            model_to_use: Model for the speculative call.
+            temperature: Sampling temperature.
+        
+        Returns:
+            Tuple of (tool results in emission order, kept response or None).
+        """
+        speculative_messages = list(messages)
+        for tool_call in tool_calls:
+            self.context.add_tool_result(
+                speculative_messages, tool_call.id, tool_call.name, self.PENDING_RESULT
+            )
+        
+        tool_task = asyncio.create_task(self.tools.execute_calls(tool_calls, execute))
+        chat_task = asyncio.create_task(self.provider.chat(
+            messages=speculative_messages,
+            tools=self.tools.get_definitions(),
+            model=model_to_use,
+            temperature=temperature,
+        ))
+        
+        try:
+            await asyncio.wait({tool_task, chat_task}, return_when=asyncio.FIRST_COMPLETED)
+            results = await tool_task
+        except BaseException:
+            chat_task.cancel()
+            raise
+        
+        if not chat_task.done():
+            chat_task.cancel()
+            return results, None
+        if chat_task.cancelled() or chat_task.exception() is not None:
+            return results, None
+        
+        response = chat_task.result()
+        if self._is_reusable_speculation(response, tool_calls):
+            logger.debug("Kept speculative response decoded during tool execution")
+            return results, response
+        return results, None
+    
+    def _is_reusable_speculation(
+        self, response: LLMResponse, pending: list[ToolCallRequest]
+    ) -> bool:
+        """
+        Check that a response decoded against PENDING_RESULT stand-ins holds without them.
+        
+        It must be another round of read-only tool calls that repeats none of
+        the pending calls (a retry means the model wanted their results) and
+        refers to neither a pending call id nor the placeholder text.
+        """
+        if not response.has_tool_calls or not self._is_read_only(response.tool_calls):
+            return False
+        
+        pending_calls = [(tc.name, tc.arguments) for tc in pending]
+        markers = [self.PENDING_RESULT, *(tc.id for tc in pending)]
+        texts = [response.content or ""]
+        for tc in response.tool_calls:
+            if (tc.name, tc.arguments) in pending_calls:
+                return False
+            texts.append(tc.serialized_arguments())
+        return not any(marker in text for marker in markers for text in texts)
+    
+    async def _execute_tool_call(self, tool_call: ToolCallRequest, model_to_use: str) -> str:
+        """
+        Execute a single tool call and record it with the tool advisor.
+        
+        Calls the advisor reports as unviable for the model are not
+        executed (or recorded); an error result is returned instead.
+        
+        Args:
+            tool_call: The tool call to execute.
+            model_to_use: Model that requested the call.
+        
+        Returns:
+            The tool result.
+        """
+        if self.tool_advisor and not self.tool_advisor.is_viable(model_to_use, tool_call.name):
+            logger.debug(f"Skipped unviable tool {tool_call.name} for {model_to_use}")
+            return self.SKIPPED_TOOL_RESULT.format(tool_call.name)
+        
+        tool_success = True
+        start_time = time.perf_counter()
+        
+        if self.tool_manager:
+            # Use tool manager with retry and circuit breaker
+            exec_result = await self.tool_manager.execute_with_retry(
+                tool_name=tool_call.name,
+                arguments=tool_call.arguments,
+                model_profile=self.model_registry.get_profile(model_to_use) if self.model_registry else None,
+                call_id=tool_call.id,
+            )
+            result = exec_result.result
+            tool_success = exec_result.success
+        else:
+            # Direct execution (fallback)
+            result, tool_success = await self.tools.execute_checked(
+                tool_call.name, tool_call.arguments
+            )
+        
+        # Track tool usage in advisor
+        if self.tool_advisor:
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            self._record_stats(
+                "advisor",
+                model_id=model_to_use,
+                tool_name=tool_call.name,
+                success=tool_success,
+                latency_ms=latency_ms,
+                error=result if not tool_success else "",
+            )
+        
+        return result
+    
     async def process_direct(
         self, 
         content: str, 
@@ -769,20 +1055,7 @@ class AgentLoop:
         Returns:
             True if the task appears to be UI-related.
         """
-        ui_indicators = [
-            r"\b(ui|ux|frontend|css|style|layout|design)\b",
-            r"\b(component|button|form|input|modal|dialog)\b",
-            r"\b(page|screen|view|interface)\b",
-            r"\b(html|jsx|tsx|react|vue|angular|svelte)\b",
-            r"\b(responsive|mobile|desktop|tablet)\b",
-            r"\b(color|font|animation|transition)\b",
-            r"\b(navbar|sidebar|footer|header)\b",
-            r"localhost:\d+",
-            r"http://.*:\d+",
-        ]
-        
-        content_lower = content.lower()
-        return any(re.search(pattern, content_lower) for pattern in ui_indicators)
+        return _UI_TASK_RE.search(content.lower()) is not None
     
     def get_routing_status(self) -> dict[str, Any]:
         """Get current routing status."""
@@ -825,6 +1098,7 @@ class AgentLoop:
         
         if self.tool_advisor:
             status["advisor_summary"] = self.tool_advisor.get_summary()
+            status["advisor_short_circuits"] = self._advisor_short_circuits
             status["problematic_combinations"] = [
                 {"model": m, "tool": t, "success_rate": r, "calls": c}
                 for m, t, r, c in self.tool_advisor.get_problematic_combinations(min_calls=5)
@@ -842,10 +1116,15 @@ class AgentLoop:
         Returns:
             Response string if handled, None otherwise.
         """
-        content = msg.content.strip()
+        # Most messages are not commands; skip them before any copying
+        content = msg.content.lstrip()
+        if not content.startswith("/"):
+            return None
+        content = content.rstrip()
+        command = content[:7].lower()
         
         # Check for /reach command (deliberation mode)
-        if content.lower().startswith("/reach "):
+        if command.startswith("/reach "):
             question = content[7:].strip()
             if question:
                 logger.info(f"Team deliberation: {question[:50]}...")
@@ -855,7 +1134,7 @@ class AgentLoop:
                 )
         
         # Check for /done command (execution mode)
-        if content.lower().startswith("/done "):
+        if command.startswith("/done "):
             task = content[6:].strip()
             if task:
                 logger.info(f"Team execution: {task[:50]}...")
@@ -865,7 +1144,7 @@ class AgentLoop:
                 )
         
         # Check for /team command (team status/info)
-        if content.lower() == "/team":
+        if command == "/team":
             status = self.team_orchestrator.get_status()
             lines = [
                 "**Agent Team Status**",
@@ -883,6 +1162,12 @@ class AgentLoop:
         """Clean up agent resources."""
         logger.info("Cleaning up agent loop resources")
         
+        # Finish pending session writes, stats updates and intent captures
+        await self.flush_sessions()
+        await self.flush_stats()
+        if self._intent_tasks:
+            await asyncio.gather(*self._intent_tasks, return_exceptions=True)
+        
         # Clean up process tool (stop dev servers)
         if self.process_tool:
             await self.process_tool.cleanup()
@@ -905,6 +1190,12 @@ class AgentLoop:
             summary: The generated summary.
             session_id: Session identifier for context.
         """
+        # Memory writes hit the filesystem and possibly the vector index
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_summary_to_memory, summary, session_id)
+    
+    def _write_summary_to_memory(self, summary: str, session_id: str) -> None:
+        """Blocking part of _save_summary_to_memory, run in the thread pool."""
         try:
             # Use enhanced memory if available
             session_note = f" (session: {session_id})" if session_id else ""
@@ -927,40 +1218,54 @@ class AgentLoop:
         except Exception as e:
             logger.warning(f"Failed to save summary to memory: {e}")
     
+    def _schedule_auto_interview(self, model_id: str) -> asyncio.Task:
+        """
+        Start an auto-interview for a model, or join the one in flight.
+        
+        Concurrent callers share a single task per model, so bursts of
+        messages and failure re-assessments run one quick assessment and
+        can all await its completion.
+        
+        Args:
+            model_id: The model identifier to interview.
+        
+        Returns:
+            The interview task for the model.
+        """
+        task = self._auto_interview_tasks.get(model_id)
+        if task is None:
+            task = asyncio.create_task(self._auto_interview_model(model_id))
+            self._auto_interview_tasks[model_id] = task
+            task.add_done_callback(lambda _: self._auto_interview_tasks.pop(model_id, None))
+        return task
+    
     async def _auto_interview_model(self, model_id: str) -> None:
         """
         Auto-interview a model if profiler is enabled and model has no profile.
         
         This runs in the background to avoid blocking the main loop.
+        Schedule it through _schedule_auto_interview so concurrent
+        triggers coalesce.
         
         Args:
             model_id: The model identifier to interview.
         """
-        if not self.config or not self.config.agents.profiler.auto_interview:
-            return
-        
-        if not self.model_registry or not self.model_interviewer:
-            return
-        
-        # Skip if already interviewed or pending
-        if self.model_registry.get_profile(model_id):
-            return
-        
-        if model_id in self._auto_interview_pending:
-            return
-        
-        self._auto_interview_pending.add(model_id)
-        logger.info(f"Auto-interviewing model: {model_id}")
-        
         try:
+            if not self._auto_interview:
+                return
+            
+            # Skip if already interviewed
+            if self.model_registry.get_profile(model_id):
+                return
+            
+            logger.info(f"Auto-interviewing model: {model_id}")
+            
             # Run quick assessment (faster than full interview)
             profile = await self.model_interviewer.quick_assessment(model_id)
-            self.model_registry.save_profile(profile)
+            await self.model_registry.save_profile_async(profile)
             logger.info(f"Auto-interview complete for {model_id}, overall score: {profile.get_overall_score():.2f}")
         except Exception as e:
             logger.warning(f"Auto-interview failed for {model_id}: {e}")
-        finally:
-            self._auto_interview_pending.discard(model_id)
     
     async def _quick_assess_on_failure(self, model_id: str) -> None:
         """
@@ -989,6 +1294,6 @@ class AgentLoop:
         
         failure_rate = 1 - stats.success_rate
         if failure_rate > 0.3:  # More than 30% failure rate
-            if model_id not in self._auto_interview_pending:
+            if model_id not in self._auto_interview_tasks:
                 logger.warning(f"High failure rate ({failure_rate:.1%}) for {model_id}, triggering re-assessment")
-                await self._auto_interview_model(model_id)
+            await self._schedule_auto_interview(model_id)
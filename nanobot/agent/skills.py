@@ -37,7 +37,7 @@ class SkillsLoader:
         
         # Workspace skills (highest priority)
         if self.workspace_skills.exists():
-            for skill_dir in self.workspace_skills.iterdir():
+            for skill_dir in sorted(self.workspace_skills.iterdir()):
                 if skill_dir.is_dir():
                     skill_file = skill_dir / "SKILL.md"
                     if skill_file.exists():
@@ -45,7 +45,7 @@ class SkillsLoader:
         
         # Built-in skills
         if self.builtin_skills and self.builtin_skills.exists():
-            for skill_dir in self.builtin_skills.iterdir():
+            for skill_dir in sorted(self.builtin_skills.iterdir()):
                 if skill_dir.is_dir():
                     skill_file = skill_dir / "SKILL.md"
                     if skill_file.exists() and not any(s["name"] == skill_dir.name for s in skills):
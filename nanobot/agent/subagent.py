@@ -1,7 +1,6 @@
 """Subagent manager for background task execution."""
 
 import asyncio
-import json
 import uuid
 from pathlib import Path
 from typing import Any
@@ -123,27 +122,16 @@ class SubagentManager:
                 
                 if response.has_tool_calls:
                     # Add assistant message with tool calls
-                    tool_call_dicts = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
-                            },
-                        }
-                        for tc in response.tool_calls
-                    ]
+                    tool_call_dicts = [tc.to_message_dict() for tc in response.tool_calls]
                     messages.append({
                         "role": "assistant",
                         "content": response.content or "",
                         "tool_calls": tool_call_dicts,
                     })
                     
-                    # Execute tools
-                    for tool_call in response.tool_calls:
-                        logger.debug(f"Subagent [{task_id}] executing: {tool_call.name}")
-                        result = await tools.execute(tool_call.name, tool_call.arguments)
+                    # Execute tools (read-only ones concurrently), keeping call order
+                    results = await tools.execute_calls(response.tool_calls)
+                    for tool_call, result in zip(response.tool_calls, results):
                         messages.append({
                             "role": "tool",
                             "tool_call_id": tool_call.id,
@@ -5,13 +5,87 @@ Determines when to automatically use swarm execution based on task complexity.
 Inspired by Kimi K2.5's Agent Swarm capabilities.
 """
 
+import functools
 from typing import TYPE_CHECKING
 
+from nanobot.routing.classifier import TaskType
+
 if TYPE_CHECKING:
-    from nanobot.routing.classifier import ClassificationResult, TaskType
+    from nanobot.routing.classifier import ClassificationResult
     from nanobot.config.schema import SwarmConfig
 
 
+# Keyword indicators of a swarm-worthy request
+SWARM_KEYWORDS = (
+    "comprehensive",
+    "multiple",
+    "compare",
+    "analyze all",
+    "research",
+    "investigate",
+    "deep dive",
+    "thorough",
+    "systematic",
+    "in-depth",
+    "evaluate multiple",
+    "pros and cons",
+    "trade-offs",
+)
+
+# Keywords reported by get_complexity_score
+BREAKDOWN_KEYWORDS = (
+    "comprehensive", "multiple", "compare", "analyze all",
+    "research", "investigate", "deep dive", "thorough",
+)
+
+# Multi-step indicators
+MULTI_STEP_PATTERNS = (
+    "first", "then", "finally",
+    "step 1", "step 2",
+    "1.", "2.", "3.",
+    "design and implement",
+    "research and summarize",
+    "analyze and recommend",
+)
+
+# Most the keyword (2) and multi-step (1) indicators can add to a score
+MAX_TEXT_SCORE = 3
+
+# Messages up to this length have their text score cached; retries and
+# common phrasings repeat, and short keys keep the cache small
+TEXT_SCORE_CACHE_MAX_CHARS = 500
+
+# Task types that are inherently complex
+COMPLEX_TASK_TYPES = frozenset({
+    TaskType.RESEARCH,
+    TaskType.COMPLEX_ANALYSIS,
+    TaskType.BRAINSTORM,
+})
+
+# Swarm pattern for each task type
+_PATTERN_MAP = {
+    # Research pattern
+    TaskType.RESEARCH: "research",
+    TaskType.COMPLEX_ANALYSIS: "research",
+    TaskType.SIMPLE_QUERY: "research",
+    
+    # Code pattern
+    TaskType.CODE: "code",
+    TaskType.IMPLEMENT: "code",
+    TaskType.DEBUG: "code",
+    TaskType.REFACTOR: "code",
+    
+    # Brainstorm pattern
+    TaskType.BRAINSTORM: "brainstorm",
+    TaskType.CREATIVE: "brainstorm",
+    
+    # Default fallbacks
+    TaskType.CHAT: "research",
+    TaskType.TASK_MANAGEMENT: "research",
+    TaskType.UNKNOWN: "research",
+}
+
+
 def should_use_swarm(
     message: str,
     classification: "ClassificationResult",
@@ -35,12 +109,16 @@ def should_use_swarm(
     Returns:
         Tuple of (should_use_swarm, suggested_pattern).
     """
-    from nanobot.routing.classifier import TaskType
-    
     # Check if swarm is enabled
     if config and not config.enabled:
         return False, ""
     
+    lower = message.lower()
+    
+    # Explicit triggers always activate swarm
+    if "/swarm" in lower:
+        return True, auto_select_pattern(classification)
+    
     # Check for auto-trigger setting
     auto_trigger = True
     complexity_threshold = 3
@@ -50,21 +128,17 @@ def should_use_swarm(
     
     if not auto_trigger:
         # Only trigger on explicit command
-        if "/swarm" in message.lower():
-            return True, auto_select_pattern(classification)
         return False, ""
     
-    # Explicit triggers always activate swarm
-    if "/swarm" in message.lower():
-        return True, auto_select_pattern(classification)
+    mlen = len(message)
     
     # Calculate complexity score
     complexity_score = 0
     
     # Long messages indicate complex requests
-    if len(message) > 500:
+    if mlen > 500:
         complexity_score += 1
-    if len(message) > 1000:
+    if mlen > 1000:
         complexity_score += 1
     
     # Specialist tier indicates complex task
@@ -72,48 +146,20 @@ def should_use_swarm(
         complexity_score += 2
     
     # Certain task types are inherently complex
-    complex_task_types = [
-        TaskType.RESEARCH,
-        TaskType.COMPLEX_ANALYSIS,
-        TaskType.BRAINSTORM,
-    ]
-    if classification.task_type in complex_task_types:
+    if classification.task_type in COMPLEX_TASK_TYPES:
         complexity_score += 2
     
-    # Keyword indicators
-    swarm_keywords = [
-        "comprehensive",
-        "multiple",
-        "compare",
-        "analyze all",
-        "research",
-        "investigate",
-        "deep dive",
-        "thorough",
-        "systematic",
-        "in-depth",
-        "evaluate multiple",
-        "pros and cons",
-        "trade-offs",
-    ]
-    
-    keyword_matches = sum(1 for kw in swarm_keywords if kw in message.lower())
-    if keyword_matches >= 1:
-        complexity_score += 1
-    if keyword_matches >= 2:
-        complexity_score += 1
+    # Decide on the cheap signals alone when the text scans can't change
+    # the outcome (they add at most MAX_TEXT_SCORE)
+    if complexity_score >= complexity_threshold:
+        return True, auto_select_pattern(classification)
+    if complexity_score + MAX_TEXT_SCORE < complexity_threshold:
+        return False, ""
     
-    # Multi-step indicators
-    multi_step_patterns = [
-        "first", "then", "finally",
-        "step 1", "step 2",
-        "1.", "2.", "3.",
-        "design and implement",
-        "research and summarize",
-        "analyze and recommend",
-    ]
-    if any(p in message.lower() for p in multi_step_patterns):
-        complexity_score += 1
+    if mlen <= TEXT_SCORE_CACHE_MAX_CHARS:
+        complexity_score += _cached_text_score(lower)
+    else:
+        complexity_score += _text_score(lower)
     
     # Determine if swarm should be used
     should_swarm = complexity_score >= complexity_threshold
@@ -125,6 +171,39 @@ def should_use_swarm(
     return False, ""
 
 
+def _text_score(lower: str) -> int:
+    """
+    Score keyword and multi-step indicators in a lowercased message.
+    
+    Substring tests beat a fused regex here: str.__contains__ is a C fast
+    search per keyword, and the whole scan stops at MAX_TEXT_SCORE.
+    
+    Args:
+        lower: The lowercased user message.
+    
+    Returns:
+        Score between 0 and MAX_TEXT_SCORE.
+    """
+    score = 0
+    for kw in SWARM_KEYWORDS:
+        if kw in lower:
+            score += 1
+            if score == 2:
+                break
+    
+    # Multi-step indicators
+    for p in MULTI_STEP_PATTERNS:
+        if p in lower:
+            return score + 1
+    return score
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_text_score(lower: str) -> int:
+    """Memoized _text_score for short messages."""
+    return _text_score(lower)
+
+
 def auto_select_pattern(classification: "ClassificationResult") -> str:
     """
     Auto-select the best swarm pattern based on task classification.
@@ -135,32 +214,7 @@ def auto_select_pattern(classification: "ClassificationResult") -> str:
     Returns:
         Pattern name: "research", "code", "review", or "brainstorm".
     """
-    from nanobot.routing.classifier import TaskType
-    
-    # Map task types to patterns
-    pattern_map = {
-        # Research pattern
-        TaskType.RESEARCH: "research",
-        TaskType.COMPLEX_ANALYSIS: "research",
-        TaskType.SIMPLE_QUERY: "research",
-        
-        # Code pattern
-        TaskType.CODE: "code",
-        TaskType.IMPLEMENT: "code",
-        TaskType.DEBUG: "code",
-        TaskType.REFACTOR: "code",
-        
-        # Brainstorm pattern
-        TaskType.BRAINSTORM: "brainstorm",
-        TaskType.CREATIVE: "brainstorm",
-        
-        # Default fallbacks
-        TaskType.CHAT: "research",
-        TaskType.TASK_MANAGEMENT: "research",
-        TaskType.UNKNOWN: "research",
-    }
-    
-    return pattern_map.get(classification.task_type, "research")
+    return _PATTERN_MAP.get(classification.task_type, "research")
 
 
 def get_complexity_score(
@@ -179,18 +233,18 @@ def get_complexity_score(
     Returns:
         Tuple of (score, list of factors that contributed).
     """
-    from nanobot.routing.classifier import TaskType
-    
+    lower = message.lower()
+    mlen = len(message)
     score = 0
     factors = []
     
     # Message length
-    if len(message) > 500:
+    if mlen > 500:
         score += 1
-        factors.append(f"Long message ({len(message)} chars)")
-    if len(message) > 1000:
+        factors.append(f"Long message ({mlen} chars)")
+    if mlen > 1000:
         score += 1
-        factors.append(f"Very long message ({len(message)} chars)")
+        factors.append(f"Very long message ({mlen} chars)")
     
     # Classification tier
     if classification.tier == "specialist":
@@ -198,17 +252,12 @@ def get_complexity_score(
         factors.append(f"Specialist tier")
     
     # Task type
-    complex_types = [TaskType.RESEARCH, TaskType.COMPLEX_ANALYSIS, TaskType.BRAINSTORM]
-    if classification.task_type in complex_types:
+    if classification.task_type in COMPLEX_TASK_TYPES:
         score += 2
         factors.append(f"Complex task type: {classification.task_type.value}")
     
     # Keywords
-    swarm_keywords = [
-        "comprehensive", "multiple", "compare", "analyze all",
-        "research", "investigate", "deep dive", "thorough",
-    ]
-    matched = [kw for kw in swarm_keywords if kw in message.lower()]
+    matched = [kw for kw in BREAKDOWN_KEYWORDS if kw in lower]
     if matched:
         score += min(len(matched), 2)
         factors.append(f"Keywords: {', '.join(matched)}")
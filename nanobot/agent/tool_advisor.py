@@ -8,7 +8,13 @@ Provides adaptive tool selection based on:
 - Learning from usage patterns
 """
 
+import atexit
 import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -16,11 +22,18 @@ from typing import Any, TYPE_CHECKING
 
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 if TYPE_CHECKING:
     from nanobot.profiler.profile import ModelProfile
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUsageStats:
     """Statistics for a tool-model combination."""
     tool_name: str
@@ -28,8 +41,8 @@ class ToolUsageStats:
     total_calls: int = 0
     successful_calls: int = 0
     total_latency_ms: float = 0.0
-    last_used: datetime = field(default_factory=datetime.now)
-    common_errors: dict[str, int] = field(default_factory=dict)
+    last_used: float = field(default_factory=time.time)  # Unix timestamp
+    common_errors: Counter[str] = field(default_factory=Counter)
     
     @property
     def success_rate(self) -> float:
@@ -53,7 +66,7 @@ class ToolUsageStats:
     ) -> None:
         """Record a tool call outcome."""
         self.total_calls += 1
-        self.last_used = datetime.now()
+        self.last_used = time.time()
         
         if success:
             self.successful_calls += 1
@@ -61,7 +74,7 @@ class ToolUsageStats:
         elif error:
             # Categorize error
             error_key = self._categorize_error(error)
-            self.common_errors[error_key] = self.common_errors.get(error_key, 0) + 1
+            self.common_errors[error_key] += 1
     
     def _categorize_error(self, error: str) -> str:
         """Categorize an error for tracking."""
@@ -87,8 +100,8 @@ class ToolUsageStats:
             "total_calls": self.total_calls,
             "successful_calls": self.successful_calls,
             "total_latency_ms": self.total_latency_ms,
-            "last_used": self.last_used.isoformat(),
-            "common_errors": self.common_errors,
+            "last_used": datetime.fromtimestamp(self.last_used).isoformat(),
+            "common_errors": dict(self.common_errors),
         }
     
     @classmethod
@@ -96,22 +109,22 @@ class ToolUsageStats:
         """Create from dictionary."""
         last_used = data.get("last_used")
         if isinstance(last_used, str):
-            last_used = datetime.fromisoformat(last_used)
+            last_used = datetime.fromisoformat(last_used).timestamp()
         else:
-            last_used = datetime.now()
+            last_used = time.time()
         
         return cls(
-            tool_name=data["tool_name"],
-            model_id=data["model_id"],
+            tool_name=sys.intern(data["tool_name"]),
+            model_id=sys.intern(data["model_id"]),
             total_calls=data.get("total_calls", 0),
             successful_calls=data.get("successful_calls", 0),
             total_latency_ms=data.get("total_latency_ms", 0.0),
             last_used=last_used,
-            common_errors=data.get("common_errors", {}),
+            common_errors=Counter(data.get("common_errors", {})),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolRecommendation:
     """A recommendation for tool usage."""
     tool_name: str
@@ -121,7 +134,7 @@ class ToolRecommendation:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AdvisorConfig:
     """Configuration for the ToolAdvisor."""
     # Thresholds for recommendations
@@ -133,16 +146,21 @@ class AdvisorConfig:
     tool_accuracy_threshold: float = 0.7  # Below this, apply penalty
     suggest_alternative_threshold: float = 0.5  # Confidence below this suggests alternative
     
+    # Skipping known-broken model-tool combinations
+    block_min_calls: int = 10  # Min calls before a combination can be skipped
+    block_max_success_rate: float = 0.1  # At or below this, the combination is skipped
+    block_retry_seconds: float = 3600.0  # Idle time before a skipped combination is retried
+    
     # Save settings
-    auto_save_interval: int = 50  # Save stats every N calls
+    flush_interval_seconds: float = 30.0  # Background save of changed stats every N seconds
 
 
 # Tool equivalence groups - tools that can substitute for each other
 TOOL_ALTERNATIVES = {
-    "read_file": ["list_dir"],  # If file read fails, maybe list dir first
-    "edit_file": ["write_file"],  # If edit fails, try full write
-    "web_search": ["web_fetch"],  # If search fails, try direct fetch
-    "exec": ["process"],  # Different process execution methods
+    "read_file": ("list_dir",),  # If file read fails, maybe list dir first
+    "edit_file": ("write_file",),  # If edit fails, try full write
+    "web_search": ("web_fetch",),  # If search fails, try direct fetch
+    "exec": ("process",),  # Different process execution methods
 }
 
 
@@ -171,24 +189,44 @@ class ToolAdvisor:
         """
         self.storage_path = storage_path
         self.config = config or AdvisorConfig()
-        self._stats: dict[str, ToolUsageStats] = {}  # key: f"{model_id}:{tool_name}"
+        self._stats: dict[tuple[str, str], ToolUsageStats] = {}  # key: (model_id, tool_name)
+        self._by_tool: dict[str, list[ToolUsageStats]] = {}  # tool_name -> stats for that tool
+        self._total_calls = 0  # Sum of total_calls over all stats, kept incrementally
+        
+        # Stats are saved by a background thread; _lock guards them against it
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._closed = threading.Event()
+        self._flush_thread: threading.Thread | None = None
         
         if storage_path:
             self._load_stats()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="tool-advisor-flush", daemon=True
+            )
+            self._flush_thread.start()
+            atexit.register(self._save_stats)
     
-    def _get_key(self, model_id: str, tool_name: str) -> str:
-        """Get storage key for a model-tool combination."""
-        return f"{model_id}:{tool_name}"
+    def _peek_stats(self, model_id: str, tool_name: str) -> ToolUsageStats | None:
+        """Get stats for a model-tool combination without creating them."""
+        return self._stats.get((model_id, tool_name))
     
     def _get_stats(self, model_id: str, tool_name: str) -> ToolUsageStats:
-        """Get or create stats for a model-tool combination."""
-        key = self._get_key(model_id, tool_name)
-        if key not in self._stats:
-            self._stats[key] = ToolUsageStats(
+        """Get or create stats for a model-tool combination (record path only)."""
+        key = (model_id, tool_name)
+        stats = self._stats.get(key)
+        if stats is None:
+            # Stored keys are interned once, when the combination is first seen
+            model_id, tool_name = sys.intern(model_id), sys.intern(tool_name)
+            stats = ToolUsageStats(
                 tool_name=tool_name,
                 model_id=model_id,
             )
-        return self._stats[key]
+            with self._lock:
+                self._stats[(model_id, tool_name)] = stats
+                self._by_tool.setdefault(tool_name, []).append(stats)
+        return stats
     
     def record_tool_call(
         self,
@@ -201,6 +239,8 @@ class ToolAdvisor:
         """
         Record a tool call outcome.
         
+        Only updates memory; the background flush thread saves the change.
+        
         Args:
             model_id: Model that made the call.
             tool_name: Tool that was called.
@@ -209,12 +249,10 @@ class ToolAdvisor:
             error: Error message if failed.
         """
         stats = self._get_stats(model_id, tool_name)
-        stats.record_call(success, latency_ms, error)
-        
-        # Periodically save
-        total_calls = sum(s.total_calls for s in self._stats.values())
-        if total_calls > 0 and total_calls % self.config.auto_save_interval == 0:
-            self._save_stats()
+        with self._lock:
+            stats.record_call(success, latency_ms, error)
+            self._total_calls += 1
+            self._dirty = True
     
     def get_recommendation(
         self,
@@ -234,21 +272,21 @@ class ToolAdvisor:
             ToolRecommendation with confidence and warnings.
         """
         cfg = self.config
-        stats = self._get_stats(model_id, tool_name)
+        min_calls = cfg.min_calls_for_confidence  # Also read per alternative below
+        stats = self._peek_stats(model_id, tool_name)  # None if never used
         warnings = []
         alternative = None
         
         # Base confidence on success rate
-        if stats.total_calls >= cfg.min_calls_for_confidence:
+        if stats and stats.total_calls >= min_calls:
             confidence = stats.success_rate
         else:
             # Not enough data - use default confidence
             confidence = cfg.default_confidence
         
         # Check for common error patterns
-        if stats.common_errors:
-            most_common_error = max(stats.common_errors, key=stats.common_errors.get)
-            error_count = stats.common_errors[most_common_error]
+        if stats and stats.common_errors:
+            most_common_error, error_count = stats.common_errors.most_common(1)[0]
             
             if error_count > cfg.error_warning_threshold:
                 warnings.append(f"Frequent '{most_common_error}' errors with this tool")
@@ -269,16 +307,20 @@ class ToolAdvisor:
         
         # Suggest alternative if confidence is low
         if confidence < cfg.suggest_alternative_threshold and tool_name in TOOL_ALTERNATIVES:
-            alternatives = TOOL_ALTERNATIVES[tool_name]
-            # Find best alternative
-            for alt in alternatives:
-                alt_stats = self._get_stats(model_id, alt)
-                if alt_stats.success_rate > confidence or alt_stats.total_calls < cfg.min_calls_for_confidence:
+            # Best known rate above our confidence wins; otherwise the first
+            # alternative without enough data to judge
+            best_rate = confidence
+            for alt in TOOL_ALTERNATIVES[tool_name]:
+                alt_stats = self._peek_stats(model_id, alt)
+                if alt_stats is None or alt_stats.total_calls < min_calls:
+                    if alternative is None:
+                        alternative = alt
+                elif alt_stats.success_rate > best_rate:
+                    best_rate = alt_stats.success_rate
                     alternative = alt
-                    break
         
         # Generate reason
-        if stats.total_calls == 0:
+        if not stats or stats.total_calls == 0:
             reason = "No usage history - proceeding with caution"
         elif confidence >= 0.8:
             reason = f"Good track record ({stats.success_rate:.0%} success rate)"
@@ -295,6 +337,33 @@ class ToolAdvisor:
             warnings=warnings,
         )
     
+    def is_viable(self, model_id: str, tool_name: str) -> bool:
+        """
+        Check whether a model-tool combination is worth executing.
+        
+        Combinations with at least block_min_calls calls and a success rate
+        at or below block_max_success_rate are not viable. Skipped calls are
+        not recorded, so a combination is let through again once it has
+        been idle for block_retry_seconds, giving it a chance to recover.
+        
+        Args:
+            model_id: Model that will call the tool.
+            tool_name: Tool to be called.
+        
+        Returns:
+            False if the combination is known to fail, True otherwise.
+        """
+        cfg = self.config
+        stats = self._peek_stats(model_id, tool_name)
+        if (
+            stats is None
+            or stats.total_calls < cfg.block_min_calls
+            or stats.success_rate > cfg.block_max_success_rate
+        ):
+            return True
+        
+        return time.time() - stats.last_used >= cfg.block_retry_seconds
+    
     def get_best_model_for_tool(
         self,
         tool_name: str,
@@ -315,10 +384,12 @@ class ToolAdvisor:
         best_model = None
         best_rate = 0.0
         
+        # Only models with history for the tool; no empty stats are created
+        tool_stats = {s.model_id: s for s in self._by_tool.get(tool_name, ())}
         for model_id in available_models:
-            stats = self._get_stats(model_id, tool_name)
+            stats = tool_stats.get(model_id)
             
-            if stats.total_calls >= min_calls:
+            if stats and stats.total_calls >= min_calls:
                 if stats.success_rate > best_rate:
                     best_rate = stats.success_rate
                     best_model = model_id
@@ -342,8 +413,8 @@ class ToolAdvisor:
         """
         candidates = []
         
-        for key, stats in self._stats.items():
-            if stats.tool_name == tool_name and stats.total_calls > 0:
+        for stats in self._by_tool.get(tool_name, ()):
+            if stats.total_calls > 0:
                 candidates.append((
                     stats.model_id,
                     stats.success_rate,
@@ -372,16 +443,16 @@ class ToolAdvisor:
         """
         matrix: dict[str, dict[str, float]] = {}
         
-        for key, stats in self._stats.items():
-            if model_ids and stats.model_id not in model_ids:
+        for (model_id, tool_name), stats in self._stats.items():
+            if model_ids and model_id not in model_ids:
                 continue
-            if tool_names and stats.tool_name not in tool_names:
+            if tool_names and tool_name not in tool_names:
                 continue
             
-            if stats.model_id not in matrix:
-                matrix[stats.model_id] = {}
+            if model_id not in matrix:
+                matrix[model_id] = {}
             
-            matrix[stats.model_id][stats.tool_name] = stats.success_rate
+            matrix[model_id][tool_name] = stats.success_rate
         
         return matrix
     
@@ -402,42 +473,68 @@ class ToolAdvisor:
         """
         problematic = []
         
-        for stats in self._stats.values():
-            if stats.total_calls >= min_calls and stats.success_rate <= max_success_rate:
-                problematic.append((
-                    stats.model_id,
-                    stats.tool_name,
-                    stats.success_rate,
-                    stats.total_calls,
-                ))
+        for (model_id, tool_name), stats in self._stats.items():
+            calls = stats.total_calls
+            if calls < min_calls:
+                continue
+            rate = stats.success_rate
+            if rate <= max_success_rate:
+                problematic.append((model_id, tool_name, rate, calls))
         
         # Sort by success rate ascending (worst first)
         problematic.sort(key=lambda x: x[2])
         
         return problematic
     
+    def _flush_loop(self) -> None:
+        """Save changed statistics every flush_interval_seconds until closed (daemon thread)."""
+        while not self._closed.wait(self.config.flush_interval_seconds):
+            self._save_stats()
+    
+    def close(self) -> None:
+        """Stop the background flush thread and save pending changes."""
+        self._closed.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+            atexit.unregister(self._save_stats)
+        self._save_stats()
+    
     def _save_stats(self) -> None:
-        """Save statistics to storage."""
+        """Save statistics to storage if they changed since the last save."""
         if not self.storage_path:
             return
         
-        try:
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            data = {
-                "version": "1.0",
-                "updated_at": datetime.now().isoformat(),
-                "stats": {
-                    key: stats.to_dict()
-                    for key, stats in self._stats.items()
-                },
-            }
+        with self._save_lock:
+            # Snapshot under the lock; serialize and write outside it
+            with self._lock:
+                if not self._dirty:
+                    return
+                self._dirty = False
+                data = {
+                    "version": "1.0",
+                    "updated_at": datetime.now().isoformat(),
+                    "stats": {
+                        f"{model_id}:{tool_name}": stats.to_dict()
+                        for (model_id, tool_name), stats in self._stats.items()
+                    },
+                }
             
-            with open(self.storage_path, "w") as f:
-                json.dump(data, f, indent=2)
-                
-        except Exception as e:
-            logger.warning(f"Failed to save tool advisor stats: {e}")
+            try:
+                if ORJSON_AVAILABLE:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(data, indent=2).encode()
+                # Write a temp file and swap it in, so a crash never leaves a truncated file
+                self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.storage_path)
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True
+                logger.warning(f"Failed to save tool advisor stats: {e}")
     
     def _load_stats(self) -> None:
         """Load statistics from storage."""
@@ -445,11 +542,17 @@ class ToolAdvisor:
             return
         
         try:
-            with open(self.storage_path) as f:
-                data = json.load(f)
+            raw = self.storage_path.read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
-            for key, stats_data in data.get("stats", {}).items():
-                self._stats[key] = ToolUsageStats.from_dict(stats_data)
+            # Keys are rebuilt from the records; model ids may contain ":"
+            for stats_data in data.get("stats", {}).values():
+                stats = ToolUsageStats.from_dict(stats_data)
+                self._stats[(stats.model_id, stats.tool_name)] = stats
+            self._by_tool = {}
+            for stats in self._stats.values():
+                self._by_tool.setdefault(stats.tool_name, []).append(stats)
+            self._total_calls = sum(s.total_calls for s in self._stats.values())
             
             logger.debug(f"Loaded {len(self._stats)} tool usage records")
             
@@ -458,11 +561,11 @@ class ToolAdvisor:
     
     def get_summary(self) -> dict[str, Any]:
         """Get summary statistics."""
-        total_calls = sum(s.total_calls for s in self._stats.values())
+        total_calls = self._total_calls
         total_successes = sum(s.successful_calls for s in self._stats.values())
         
-        unique_models = set(s.model_id for s in self._stats.values())
-        unique_tools = set(s.tool_name for s in self._stats.values())
+        unique_models = set(model_id for model_id, _ in self._stats)
+        unique_tools = set(tool_name for _, tool_name in self._stats)
         
         return {
             "total_combinations": len(self._stats),
@@ -441,7 +441,7 @@ class ToolCallManager:
         Returns:
             ExecutionResult with outcome details.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # 1. Pre-execution validation
         if self.enable_validation:
@@ -451,7 +451,7 @@ class ToolCallManager:
                     success=False,
                     result=f"Validation failed: {'; '.join(validation.errors)}",
                     attempts=0,
-                    total_time=time.time() - start_time,
+                    total_time=time.perf_counter() - start_time,
                     validation_errors=validation.errors,
                 )
             
@@ -466,7 +466,7 @@ class ToolCallManager:
                 success=False,
                 result=f"Policy blocked: {policy_check.reason}",
                 attempts=0,
-                total_time=time.time() - start_time,
+                total_time=time.perf_counter() - start_time,
                 policy_blocked=True,
             )
         
@@ -492,10 +492,10 @@ class ToolCallManager:
         for attempt in range(max_retries + 1):
             try:
                 # Execute the tool
-                result = await self.registry.execute(tool_name, arguments)
+                result, ok = await self.registry.execute_checked(tool_name, arguments)
                 
                 # Check if result indicates an error
-                if result.startswith("Error:"):
+                if not ok:
                     error_type = self._classify_error(result)
                     last_error = result
                     last_error_type = error_type
@@ -517,7 +517,7 @@ class ToolCallManager:
                             success=False,
                             result=result,
                             attempts=attempt + 1,
-                            total_time=time.time() - start_time,
+                            total_time=time.perf_counter() - start_time,
                             error_type=error_type,
                         )
                 
@@ -527,7 +527,7 @@ class ToolCallManager:
                     success=True,
                     result=result,
                     attempts=attempt + 1,
-                    total_time=time.time() - start_time,
+                    total_time=time.perf_counter() - start_time,
                 )
                 
             except asyncio.TimeoutError:
@@ -558,7 +558,7 @@ class ToolCallManager:
             success=False,
             result=last_error or f"Error: Tool '{tool_name}' failed after {max_retries + 1} attempts",
             attempts=max_retries + 1,
-            total_time=time.time() - start_time,
+            total_time=time.perf_counter() - start_time,
             error_type=last_error_type,
         )
     
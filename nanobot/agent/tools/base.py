@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+# Prefix of string results that report a tool failure
+TOOL_ERROR_PREFIX = "Error:"
+
 
 @dataclass
 class ToolResult:
@@ -36,6 +39,9 @@ class Tool(ABC):
     the environment, such as reading files, executing commands, etc.
     """
     
+    # Whether the tool changes state. Read-only tools may run concurrently.
+    is_mutating: bool = True
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -77,6 +83,17 @@ class Tool(ABC):
                 "parameters": self.parameters,
             }
         }
+    
+    def is_error(self, result: str) -> bool:
+        """
+        Check whether a string result from this tool reports a failure.
+        
+        Tools report failures either by returning a failed ToolResult or a
+        string starting with "Error:" (the form ToolResult.to_string uses).
+        Tools whose successful output may start with that text should
+        return ToolResult for failures and override this to return False.
+        """
+        return result.startswith(TOOL_ERROR_PREFIX)
 
 
 # Alias for backward compatibility
@@ -12,7 +12,6 @@ from typing import Any
 from loguru import logger
 
 from nanobot.agent.tools.base import BaseTool, ToolResult
-from nanobot.ui.versions import get_version_manager
 
 
 class DashboardTool(BaseTool):
@@ -41,6 +40,9 @@ class DashboardTool(BaseTool):
     
     def __init__(self):
         super().__init__()
+        # Imported here: nanobot.ui pulls in the aiohttp web server, which
+        # every importer of nanobot.agent.tools would otherwise pay for
+        from nanobot.ui.versions import get_version_manager
         self._version_manager = get_version_manager()
         self._dashboard_dir = Path(__file__).parent.parent.parent / "ui" / "dashboard"
         self._ws_broadcast: callable | None = None
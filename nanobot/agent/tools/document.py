@@ -259,7 +259,7 @@ Example for surgical_plan:
                 return f"Document preview:\n\n{doc.content}"
                 
         except ValueError as e:
-            return f"Error generating document: {e}"
+            return f"Error: Failed to generate document: {e}"
         except Exception as e:
             return f"Unexpected error: {e}"
 
@@ -267,6 +267,8 @@ Example for surgical_plan:
 class ListTemplatesToolTool(Tool):
     """Tool to list available document templates."""
     
+    is_mutating = False
+    
     @property
     def name(self) -> str:
         return "list_document_templates"
@@ -3,12 +3,14 @@
 from pathlib import Path
 from typing import Any
 
-from nanobot.agent.tools.base import Tool
+from nanobot.agent.tools.base import Tool, ToolResult
 
 
 class ReadFileTool(Tool):
     """Tool to read file contents."""
     
+    is_mutating = False
+    
     @property
     def name(self) -> str:
         return "read_file"
@@ -30,20 +32,24 @@ class ReadFileTool(Tool):
             "required": ["path"]
         }
     
-    async def execute(self, path: str, **kwargs: Any) -> str:
+    async def execute(self, path: str, **kwargs: Any) -> str | ToolResult:
         try:
             file_path = Path(path).expanduser()
             if not file_path.exists():
-                return f"Error: File not found: {path}"
+                return ToolResult(success=False, error=f"File not found: {path}")
             if not file_path.is_file():
-                return f"Error: Not a file: {path}"
+                return ToolResult(success=False, error=f"Not a file: {path}")
             
             content = file_path.read_text(encoding="utf-8")
             return content
         except PermissionError:
-            return f"Error: Permission denied: {path}"
+            return ToolResult(success=False, error=f"Permission denied: {path}")
         except Exception as e:
-            return f"Error reading file: {str(e)}"
+            return ToolResult(success=False, error=f"Failed to read file: {str(e)}")
+    
+    def is_error(self, result: str) -> bool:
+        # Failures come back as ToolResult; any string is file content
+        return False
 
 
 class WriteFileTool(Tool):
@@ -83,7 +89,7 @@ class WriteFileTool(Tool):
         except PermissionError:
             return f"Error: Permission denied: {path}"
         except Exception as e:
-            return f"Error writing file: {str(e)}"
+            return f"Error: Failed to write file: {str(e)}"
 
 
 class EditFileTool(Tool):
@@ -141,12 +147,14 @@ class EditFileTool(Tool):
         except PermissionError:
             return f"Error: Permission denied: {path}"
         except Exception as e:
-            return f"Error editing file: {str(e)}"
+            return f"Error: Failed to edit file: {str(e)}"
 
 
 class ListDirTool(Tool):
     """Tool to list directory contents."""
     
+    is_mutating = False
+    
     @property
     def name(self) -> str:
         return "list_dir"
@@ -188,4 +196,4 @@ class ListDirTool(Tool):
         except PermissionError:
             return f"Error: Permission denied: {path}"
         except Exception as e:
-            return f"Error listing directory: {str(e)}"
+            return f"Error: Failed to list directory: {str(e)}"
@@ -180,7 +180,7 @@ NOTE: This tool requires elevated mode.
             
             return f"Set {path} = {value}"
         except (KeyError, AttributeError) as e:
-            return f"Error setting config: {str(e)}"
+            return f"Error: Failed to set config: {str(e)}"
     
     def _config_list(self) -> str:
         """List configuration sections."""
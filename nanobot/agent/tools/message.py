@@ -83,4 +83,4 @@ class MessageTool(Tool):
             await self._send_callback(msg)
             return f"Message sent to {channel}:{chat_id}"
         except Exception as e:
-            return f"Error sending message: {str(e)}"
+            return f"Error: Failed to send message: {str(e)}"
@@ -393,7 +393,7 @@ Regular Process Examples:
                 )
                 
         except Exception as e:
-            return f"Error starting dev server: {str(e)}"
+            return f"Error: Failed to start dev server: {str(e)}"
     
     def _get_output(self, pid: str, lines: int = 20) -> str:
         """Get recent output from a process."""
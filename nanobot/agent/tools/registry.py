@@ -1,8 +1,15 @@
 """Tool registry for dynamic tool management."""
 
-from typing import Any
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
-from nanobot.agent.tools.base import Tool
+from loguru import logger
+
+from nanobot.agent.tools.base import Tool, ToolResult
+
+if TYPE_CHECKING:
+    from nanobot.providers.base import ToolCallRequest
 
 
 class ToolRegistry:
@@ -14,14 +21,17 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._definitions: list[dict[str, Any]] | None = None
     
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._definitions = None
     
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
-        self._tools.pop(name, None)
+        if self._tools.pop(name, None) is not None:
+            self._definitions = None
     
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -31,9 +41,24 @@ class ToolRegistry:
         """Check if a tool is registered."""
         return name in self._tools
     
+    def is_mutating(self, name: str) -> bool:
+        """Check if a tool may change state (unknown tools are read-only)."""
+        tool = self._tools.get(name)
+        return tool.is_mutating if tool else False
+    
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """
+        Get all tool definitions in OpenAI format.
+        
+        Definitions are sorted by name and cached until the registry changes,
+        so every turn sends byte-identical tools and provider prompt caching
+        keeps hitting. Callers must not mutate the returned list.
+        """
+        if self._definitions is None:
+            self._definitions = [
+                self._tools[name].to_schema() for name in sorted(self._tools)
+            ]
+        return self._definitions
     
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """
@@ -45,18 +70,88 @@ class ToolRegistry:
         
         Returns:
             Tool execution result as string.
+        """
+        result, _ = await self.execute_checked(name, params)
+        return result
+    
+    async def execute_checked(self, name: str, params: dict[str, Any]) -> tuple[str, bool]:
+        """
+        Execute a tool and report whether it succeeded.
+        
+        Failures are a missing tool, an exception, a failed ToolResult, or a
+        string the tool itself classifies as an error (Tool.is_error).
+        
+        Args:
+            name: Tool name.
+            params: Tool parameters.
         
-        Raises:
-            KeyError: If tool not found.
+        Returns:
+            Tuple of (result string, success).
         """
         tool = self._tools.get(name)
         if not tool:
-            return f"Error: Tool '{name}' not found"
+            return f"Error: Tool '{name}' not found", False
         
         try:
-            return await tool.execute(**params)
+            result = await tool.execute(**params)
         except Exception as e:
-            return f"Error executing {name}: {str(e)}"
+            return f"Error executing {name}: {str(e)}", False
+        
+        if isinstance(result, ToolResult):
+            return result.to_string(), result.success
+        return result, not tool.is_error(result)
+    
+    async def execute_calls(
+        self,
+        tool_calls: list["ToolCallRequest"],
+        execute: Callable[["ToolCallRequest"], Awaitable[str]] | None = None,
+    ) -> list[str]:
+        """
+        Execute a turn's tool calls, running read-only tools concurrently.
+        
+        Consecutive read-only calls are gathered together; each mutating
+        call runs on its own, so reads after a write still see it. Results
+        are returned in the order the model emitted the calls.
+        
+        Args:
+            tool_calls: Tool calls from the LLM response.
+            execute: Coroutine function executing a single call
+                (defaults to this registry's execute).
+        
+        Returns:
+            Tool results, one per call.
+        """
+        if execute is None:
+            async def execute(tc: "ToolCallRequest") -> str:
+                return await self.execute(tc.name, tc.arguments)
+        
+        results: list[str] = []
+        batch: list["ToolCallRequest"] = []
+        
+        async def flush() -> None:
+            outcomes = await asyncio.gather(
+                *(execute(tc) for tc in batch), return_exceptions=True
+            )
+            for tc, outcome in zip(batch, outcomes):
+                if isinstance(outcome, BaseException):
+                    outcome = f"Error executing {tc.name}: {str(outcome)}"
+                results.append(outcome)
+            batch.clear()
+        
+        for tool_call in tool_calls:
+            logger.debug("Executing tool: {}", tool_call.name)  # Formatted only if DEBUG is handled
+            if self.is_mutating(tool_call.name):
+                if batch:
+                    await flush()
+                batch.append(tool_call)
+                await flush()
+            else:
+                batch.append(tool_call)
+        
+        if batch:
+            await flush()
+        
+        return results
     
     @property
     def tool_names(self) -> list[str]:
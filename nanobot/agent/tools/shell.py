@@ -190,4 +190,4 @@ Examples:
             return result
             
         except Exception as e:
-            return f"Error executing command: {str(e)}"
+            return f"Error: Failed to execute command: {str(e)}"
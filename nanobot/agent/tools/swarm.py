@@ -134,6 +134,8 @@ class SwarmStatusTool(Tool):
     Tool to check swarm system status.
     """
     
+    is_mutating = False
+    
     def __init__(self, orchestrator: "SwarmOrchestrator"):
         self._orchestrator = orchestrator
     
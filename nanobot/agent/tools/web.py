@@ -32,6 +32,7 @@ class WebSearchTool(Tool):
     """Search the web using Brave Search API."""
     
     name = "web_search"
+    is_mutating = False
     description = "Search the web. Returns titles, URLs, and snippets."
     parameters = {
         "type": "object",
@@ -79,6 +80,7 @@ class WebFetchTool(Tool):
     """Fetch and extract content from a URL using Readability."""
     
     name = "web_fetch"
+    is_mutating = False
     description = "Fetch URL and extract readable content (HTML → markdown/text)."
     parameters = {
         "type": "object",
@@ -8,6 +8,7 @@ from rich.console import Console
 from rich.table import Table
 
 from nanobot import __version__, __logo__
+from nanobot.utils.helpers import install_eager_task_factory, install_uvloop
 
 app = typer.Typer(
     name="gigabot",
@@ -435,6 +436,7 @@ def gateway(
     console.print(f"[green]✓[/green] Dashboard: http://{host}:{port}/")
     
     async def run():
+        install_eager_task_factory()
         try:
             # Start UI server
             await ui_server.start()
@@ -468,6 +470,8 @@ def gateway(
                 heartbeat.stop()
             cron.stop()
             if agent:
+                await agent.flush_sessions()
+                await agent.flush_stats()
                 agent.stop()
             await channels.stop_all()
             await ui_server.stop()
@@ -476,6 +480,7 @@ def gateway(
             if node_manager:
                 await node_manager.stop()
     
+    install_uvloop()
     asyncio.run(run())
 
 
@@ -606,15 +611,20 @@ def agent(
     if message:
         # Single message mode
         async def run_once():
+            install_eager_task_factory()
             response = await agent_loop.process_direct(message, session_id)
             console.print(f"\n{__logo__} {response}")
+            await agent_loop.flush_sessions()
+            await agent_loop.flush_stats()
         
+        install_uvloop()
         asyncio.run(run_once())
     else:
         # Interactive mode
         console.print(f"{__logo__} Interactive mode (Ctrl+C to exit)\n")
         
         async def run_interactive():
+            install_eager_task_factory()
             while True:
                 try:
                     user_input = console.input("[bold blue]You:[/bold blue] ")
@@ -626,7 +636,10 @@ def agent(
                 except KeyboardInterrupt:
                     console.print("\nGoodbye!")
                     break
+            await agent_loop.flush_sessions()
+            await agent_loop.flush_stats()
         
+        install_uvloop()
         asyncio.run(run_interactive())
 
 
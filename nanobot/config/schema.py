@@ -227,6 +227,15 @@ class MemoryConfig(BaseModel):
     recency_days: int = 30  # Days to consider for recency scoring
 
 
+class CompactionConfig(BaseModel):
+    """Context compaction configuration."""
+    rubric_gate: bool = False  # Ask the model whether to compact before summarizing
+    probe_interval: int = 3  # Checks to skip after the model answers CONTINUE
+    # "always_on" summarizes all older history; "focus" only low-relevance
+    # segments, into a knowledge block
+    strategy: Literal["always_on", "focus"] = "always_on"
+
+
 class SelfHealConfig(BaseModel):
     """Self-healing controls configuration."""
     enabled: bool = True
@@ -273,6 +282,9 @@ class ToolReinforcementConfig(BaseModel):
     default_confidence: float = 0.7  # Confidence when not enough data
     error_warning_threshold: int = 3  # Error count before warning
     suggest_alternative_threshold: float = 0.5  # Confidence below this suggests alternative
+    block_min_calls: int = 10  # Min calls before a failing model-tool combination is skipped
+    block_max_success_rate: float = 0.1  # Skip combinations at or below this success rate
+    block_retry_seconds: float = 3600.0  # Idle time before a skipped combination is retried
     
     # Storage
     advisor_storage_path: str = "~/.gigabot/tool_advisor.json"
@@ -413,6 +425,7 @@ class AgentsConfig(BaseModel):
     profiler: ProfilerConfig = Field(default_factory=ProfilerConfig)
     dev_workflow: DevWorkflowConfig = Field(default_factory=DevWorkflowConfig)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
+    compaction: CompactionConfig = Field(default_factory=CompactionConfig)
     self_heal: SelfHealConfig = Field(default_factory=SelfHealConfig)
     tool_reinforcement: ToolReinforcementConfig = Field(default_factory=ToolReinforcementConfig)
     intent_tracking: IntentTrackingConfig = Field(default_factory=IntentTrackingConfig)
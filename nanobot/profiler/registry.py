@@ -5,7 +5,9 @@ Stores and retrieves model profiles, provides model recommendations
 based on task requirements and role assignments.
 """
 
+import asyncio
 import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -45,6 +47,12 @@ class ModelRegistry:
             self.storage_path = self.DEFAULT_STORAGE_PATH
         
         self._profiles: dict[str, ModelProfile] = {}
+        
+        # Snapshots are numbered so a slow write never overwrites a newer one
+        self._write_lock = threading.Lock()
+        self._save_generation = 0
+        self._written_generation = 0
+        
         self._ensure_storage()
         self._load_profiles()
     
@@ -81,8 +89,11 @@ class ModelRegistry:
     
     def _save_profiles(self) -> None:
         """Save all profiles to storage."""
-        profiles_file = self.storage_path / self.PROFILES_FILE
-        
+        self._write_profiles(*self._snapshot_profiles())
+    
+    def _snapshot_profiles(self) -> tuple[int, dict[str, Any]]:
+        """Serialize all profiles, tagged with a new save generation."""
+        self._save_generation += 1
         data = {
             "version": REGISTRY_VERSION,
             "last_updated": datetime.now().isoformat(),
@@ -91,13 +102,22 @@ class ModelRegistry:
                 for model_id, profile in self._profiles.items()
             }
         }
+        return self._save_generation, data
+    
+    def _write_profiles(self, generation: int, data: dict[str, Any]) -> None:
+        """Write a profiles snapshot unless a newer one was already written."""
+        profiles_file = self.storage_path / self.PROFILES_FILE
         
-        try:
-            with open(profiles_file, "w") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Saved {len(self._profiles)} profiles")
-        except Exception as e:
-            logger.error(f"Failed to save profiles: {e}")
+        with self._write_lock:
+            if generation < self._written_generation:
+                return
+            try:
+                with open(profiles_file, "w") as f:
+                    json.dump(data, f, indent=2)
+                self._written_generation = generation
+                logger.debug(f"Saved {len(data['profiles'])} profiles")
+            except Exception as e:
+                logger.error(f"Failed to save profiles: {e}")
     
     def get_profile(self, model_id: str) -> ModelProfile | None:
         """
@@ -122,6 +142,26 @@ class ModelRegistry:
         self._save_profiles()
         logger.info(f"Saved profile for {profile.model_id}")
     
+    async def save_profile_async(self, profile: ModelProfile) -> None:
+        """
+        Save or update a model profile without blocking the event loop.
+        
+        The profile is visible to get_profile immediately; only the file
+        write runs in a worker thread.
+        
+        Args:
+            profile: The profile to save.
+        """
+        self._profiles[profile.model_id] = profile
+        await self.save_profiles_async()
+        logger.info(f"Saved profile for {profile.model_id}")
+    
+    async def save_profiles_async(self) -> None:
+        """Snapshot all profiles on the event loop and write them in a worker thread."""
+        generation, data = self._snapshot_profiles()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_profiles, generation, data)
+    
     def delete_profile(self, model_id: str) -> bool:
         """
         Delete a model profile.
@@ -300,9 +340,44 @@ class ModelRegistry:
             latency_ms: Response latency.
             error_type: Type of error if failed.
         """
+        if self._record_runtime_stats(
+            model_id, success, tool_success, tokens, latency_ms, error_type
+        ):
+            self._save_profiles()
+    
+    async def update_runtime_stats_async(
+        self,
+        model_id: str,
+        success: bool,
+        tool_success: bool | None = None,
+        tokens: int = 0,
+        latency_ms: float = 0.0,
+        error_type: str | None = None,
+    ) -> None:
+        """
+        Update runtime statistics for a model without blocking the event loop.
+        
+        Same as update_runtime_stats, but the periodic save writes the file
+        in a worker thread.
+        """
+        if self._record_runtime_stats(
+            model_id, success, tool_success, tokens, latency_ms, error_type
+        ):
+            await self.save_profiles_async()
+    
+    def _record_runtime_stats(
+        self,
+        model_id: str,
+        success: bool,
+        tool_success: bool | None,
+        tokens: int,
+        latency_ms: float,
+        error_type: str | None,
+    ) -> bool:
+        """Record a call in the model's runtime stats; return True when a save is due."""
         profile = self._profiles.get(model_id)
         if not profile:
-            return
+            return False
         
         profile.runtime_stats.record_call(
             success=success,
@@ -313,8 +388,7 @@ class ModelRegistry:
         )
         
         # Periodically save (every 100 calls)
-        if profile.runtime_stats.total_calls % 100 == 0:
-            self._save_profiles()
+        return profile.runtime_stats.total_calls % 100 == 0
     
     def compare_models(
         self,
@@ -1,19 +1,82 @@
 """Base LLM provider interface."""
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
-@dataclass
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles them
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, using orjson when installed (raises json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or integers beyond 64 bits; stdlib json accepts them
+    return json.loads(text)
+
+
+@dataclass(slots=True)
 class ToolCallRequest:
     """A tool call request from the LLM."""
     id: str
     name: str
     arguments: dict[str, Any]
+    _serialized_args: str | None = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_json(cls, id: str, name: str, raw_arguments: str) -> "ToolCallRequest":
+        """
+        Create a tool call from the provider's JSON arguments string.
+        
+        The raw string doubles as the serialized form, so echoing the call
+        back in the assistant message needs no re-serialization. Invalid
+        JSON is kept as {"raw": ...}.
+        """
+        try:
+            arguments = _loads(raw_arguments)
+        except json.JSONDecodeError:
+            return cls(id=id, name=name, arguments={"raw": raw_arguments})
+        call = cls(id=id, name=name, arguments=arguments)
+        call._serialized_args = raw_arguments
+        return call
+    
+    def serialized_arguments(self) -> str:
+        """Get arguments as a JSON string (serialized once, then cached)."""
+        if self._serialized_args is None:
+            if isinstance(self.arguments, str):
+                self._serialized_args = self.arguments
+            else:
+                self._serialized_args = _dumps_compact(self.arguments)
+        return self._serialized_args
+    
+    def to_message_dict(self) -> dict[str, Any]:
+        """Convert to the OpenAI tool_calls entry for an assistant message."""
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {"name": self.name, "arguments": self.serialized_arguments()},
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM provider."""
     content: str | None
@@ -1,7 +1,6 @@
 """LiteLLM provider implementation for multi-provider support."""
 
 import os
-import json
 import time
 from typing import Any, AsyncIterator
 from dataclasses import dataclass, field
@@ -145,6 +144,9 @@ class LiteLLMProvider(LLMProvider):
         # Health tracking (per model)
         self._model_health: dict[str, ProviderHealth] = {}
         
+        # Last tool list and its cache_control-marked copy (see _with_cache_control)
+        self._marked_tools: tuple[list[dict[str, Any]], list[dict[str, Any]]] | None = None
+        
         # Gateway tracking (for multi-gateway support)
         self._gateways: list[GatewayInfo] = []
         self._gateway_cooldown = cooldown_seconds
@@ -433,6 +435,8 @@ class LiteLLMProvider(LLMProvider):
         # Get API base from gateway or default for provider
         api_base = gateway.api_base or self.PROVIDER_CONFIGS.get(gateway.provider, {}).get("api_base")
         
+        messages, tools = self._with_cache_control(formatted_model, messages, tools)
+        
         kwargs: dict[str, Any] = {
             "model": formatted_model,
             "messages": messages,
@@ -489,6 +493,8 @@ class LiteLLMProvider(LLMProvider):
         formatted_model = self._format_model_name(model)
         api_base = self._get_api_base_for_model(model)
         
+        messages, tools = self._with_cache_control(formatted_model, messages, tools)
+        
         kwargs: dict[str, Any] = {
             "model": formatted_model,
             "messages": messages,
@@ -510,6 +516,67 @@ class LiteLLMProvider(LLMProvider):
         response = await acompletion(**kwargs)
         return self._parse_response(response)
     
+    def _with_cache_control(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+        """
+        Mark the static prompt prefix as cacheable for Claude models.
+        
+        Anthropic only caches prompt prefixes that end in a cache_control
+        breakpoint, and allows four per request. They go on the last tool
+        definition, the invariant system prompt, the last of the leading
+        system messages (memory and compaction summaries, which change less
+        often than history), and the final user turn so the conversation so
+        far is reused by the next request. Other models are returned
+        unchanged, and the caller's lists are never mutated. The marked
+        tool list is reused while the caller keeps passing the same
+        (registry-cached) list.
+        
+        Args:
+            model: Formatted LiteLLM model name.
+            messages: Message list for the request.
+            tools: Tool definitions for the request.
+        
+        Returns:
+            Tuple of (messages, tools) to send.
+        """
+        if "claude" not in model.lower():
+            return messages, tools
+        
+        ephemeral = {"type": "ephemeral"}
+        
+        def mark(message: dict[str, Any]) -> dict[str, Any]:
+            return {
+                **message,
+                "content": [{"type": "text", "text": message["content"], "cache_control": ephemeral}],
+            }
+        
+        breakpoints = set()
+        system_end = 0
+        while system_end < len(messages) and messages[system_end].get("role") == "system":
+            system_end += 1
+        if system_end:
+            breakpoints.update((0, system_end - 1))
+        if len(messages) > system_end and messages[-1].get("role") == "user":
+            breakpoints.add(len(messages) - 1)
+        
+        breakpoints = [i for i in sorted(breakpoints) if isinstance(messages[i].get("content"), str)]
+        if breakpoints:
+            messages = list(messages)
+            for i in breakpoints:
+                messages[i] = mark(messages[i])
+        
+        if tools:
+            if self._marked_tools is None or self._marked_tools[0] is not tools:
+                marked = [*tools[:-1], {**tools[-1], "cache_control": ephemeral}]
+                self._marked_tools = (tools, marked)
+            tools = self._marked_tools[1]
+        
+        return messages, tools
+    
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse LiteLLM response into our standard format."""
         choice = response.choices[0]
@@ -521,10 +588,8 @@ class LiteLLMProvider(LLMProvider):
                 # Parse arguments from JSON string if needed
                 args = tc.function.arguments
                 if isinstance(args, str):
-                    try:
-                        args = json.loads(args)
-                    except json.JSONDecodeError:
-                        args = {"raw": args}
+                    tool_calls.append(ToolCallRequest.from_json(tc.id, tc.function.name, args))
+                    continue
                 
                 tool_calls.append(ToolCallRequest(
                     id=tc.id,
@@ -10,6 +10,7 @@ Supports:
 """
 
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -92,6 +93,10 @@ class TieredRouter:
     classifier: TaskClassifier = field(default_factory=TaskClassifier)
     fallback_tier: str = "daily_driver"
     cooldown_seconds: int = 300
+    classification_cache_size: int = 1024
+    
+    # Recent classifications by message (classification ignores model health)
+    _classification_cache: OrderedDict[str, ClassificationResult] = field(default_factory=OrderedDict)
     
     # Health tracking for models
     _model_health: dict[str, ModelHealth] = field(default_factory=dict)
@@ -118,7 +123,7 @@ class TieredRouter:
             RoutingDecision with selected model and tier.
         """
         # Classify the task
-        classification = self.classifier.classify(message, context)
+        classification = self._classify(message, context)
         
         # Determine tier
         if force_tier and force_tier in self.tiers:
@@ -150,6 +155,32 @@ class TieredRouter:
             fallback_reason=fallback_reason,
         )
     
+    def _classify(
+        self,
+        message: str,
+        context: dict[str, Any] | None,
+    ) -> ClassificationResult:
+        """
+        Classify a message, reusing the result for recently seen messages.
+        
+        Only context-free classifications are cached; model selection
+        still runs per call so health changes take effect immediately.
+        """
+        if context is not None:
+            return self.classifier.classify(message, context)
+        
+        cache = self._classification_cache
+        classification = cache.get(message)
+        if classification is not None:
+            cache.move_to_end(message)
+            return classification
+        
+        classification = self.classifier.classify(message)
+        cache[message] = classification
+        if len(cache) > self.classification_cache_size:
+            cache.popitem(last=False)
+        return classification
+    
     def _select_model(self, tier: TierConfig) -> tuple[str, bool, str]:
         """
         Select an available model from the tier.
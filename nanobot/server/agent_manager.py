@@ -176,9 +176,10 @@ class AgentManager:
                 self._tracker = TokenTracker()
                 logger.debug("Created TokenTracker")
                 
-                # Create agent loop
+                # Create agent loop (replacing any previous one)
                 from nanobot.agent.loop import AgentLoop
                 
+                await self._close_agent()
                 logger.info("Creating AgentLoop...")
                 self._agent = AgentLoop(
                     bus=self._bus,
@@ -271,9 +272,20 @@ class AgentManager:
     async def shutdown(self) -> None:
         """Shutdown the agent manager."""
         logger.info("Shutting down agent manager")
-        self._agent = None
+        await self._close_agent()
         self._state = AgentState.UNINITIALIZED
     
+    async def _close_agent(self) -> None:
+        """Persist the current agent's pending sessions and stats, then stop it."""
+        agent, self._agent = self._agent, None
+        if agent is None:
+            return
+        try:
+            await agent.flush_sessions()
+            await agent.flush_stats()
+        finally:
+            agent.stop()
+    
     def _has_api_key(self) -> bool:
         """Check if any API key is configured."""
         return self._get_api_key() is not None
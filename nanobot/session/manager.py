@@ -1,6 +1,7 @@
 """Session management for conversation history."""
 
 import json
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -36,6 +37,16 @@ class Session:
         self.messages.append(msg)
         self.updated_at = datetime.now()
     
+    def add_turn(self, user_content: str, assistant_content: str) -> None:
+        """Add a user message and the assistant's reply in one update."""
+        now = datetime.now()
+        timestamp = now.isoformat()
+        self.messages.extend((
+            {"role": "user", "content": user_content, "timestamp": timestamp},
+            {"role": "assistant", "content": assistant_content, "timestamp": timestamp},
+        ))
+        self.updated_at = now
+    
     def get_history(self, max_messages: int = 50) -> list[dict[str, Any]]:
         """
         Get message history for LLM context.
@@ -65,10 +76,15 @@ class SessionManager:
     Sessions are stored as JSONL files in the sessions directory.
     """
     
+    LINE_CACHE_SIZE = 32  # Most recently saved sessions whose serialized lines are kept
+    
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.sessions_dir = ensure_dir(Path.home() / ".nanobot" / "sessions")
         self._cache: dict[str, Session] = {}
+        # Serialized message lines per session, reused by the next save while
+        # the session keeps appending to the same list (LRU, serialize() only)
+        self._lines: OrderedDict[str, tuple[list[dict[str, Any]], list[str]]] = OrderedDict()
     
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
@@ -135,23 +151,67 @@ class SessionManager:
     
     def save(self, session: Session) -> None:
         """Save a session to disk."""
-        path = self._get_session_path(session.key)
-        
-        with open(path, "w") as f:
-            # Write metadata first
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata
-            }
-            f.write(json.dumps(metadata_line) + "\n")
-            
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
+        self.write(session.key, self.serialize(session))
+    
+    def serialize(self, session: Session) -> str:
+        """
+        Serialize a session to its JSONL file contents.
+        
+        Call this on the thread that mutates the session (the event loop);
+        the returned text is an immutable snapshot that write() can put on
+        disk from any thread.
+        
+        Args:
+            session: The session to serialize.
+        
+        Returns:
+            The file contents.
+        """
+        # Metadata first, then messages
+        metadata_line = {
+            "_type": "metadata",
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata
+        }
+        lines = [json.dumps(metadata_line)]
+        lines.extend(self._message_lines(session))
+        lines.append("")
         
         self._cache[session.key] = session
+        return "\n".join(lines)
+    
+    def write(self, key: str, text: str) -> None:
+        """
+        Write serialized session contents to disk.
+        
+        Args:
+            key: Session key.
+            text: File contents from serialize().
+        """
+        with open(self._get_session_path(key), "w") as f:
+            f.write(text)
+    
+    def _message_lines(self, session: Session) -> list[str]:
+        """
+        Get the JSONL lines for a session's messages.
+        
+        Messages are append-only between saves, so only messages added since
+        the previous save are serialized. A replaced list (e.g. after clear())
+        or a session evicted from the LRU is serialized from scratch.
+        """
+        messages = session.messages
+        cached = self._lines.pop(session.key, None)
+        if cached is not None and cached[0] is messages and len(cached[1]) <= len(messages):
+            lines = cached[1]
+        else:
+            lines = []
+        lines.extend(json.dumps(msg) for msg in messages[len(lines):])
+        
+        self._lines[session.key] = (messages, lines)
+        if len(self._lines) > self.LINE_CACHE_SIZE:
+            self._lines.popitem(last=False)
+        return lines
     
     def delete(self, key: str) -> bool:
         """
@@ -165,6 +225,7 @@ class SessionManager:
         """
         # Remove from cache
         self._cache.pop(key, None)
+        self._lines.pop(key, None)
         
         # Remove file
         path = self._get_session_path(key)
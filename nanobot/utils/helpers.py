@@ -1,5 +1,6 @@
 """Utility functions for nanobot."""
 
+import asyncio
 from pathlib import Path
 from datetime import datetime
 
@@ -89,3 +90,38 @@ def parse_session_key(key: str) -> tuple[str, str]:
     if len(parts) != 2:
         raise ValueError(f"Invalid session key: {key}")
     return parts[0], parts[1]
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop policy when uvloop is installed.
+    
+    Must be called before the event loop is created (i.e. before asyncio.run).
+    
+    Returns:
+        True if uvloop was installed, False if falling back to asyncio.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def install_eager_task_factory() -> bool:
+    """
+    Run new tasks eagerly on the running event loop.
+    
+    Eager tasks execute synchronously until their first suspension, which
+    skips a scheduling round-trip for tasks that finish quickly. Needs
+    Python 3.12+; older interpreters keep the default factory.
+    
+    Returns:
+        True if the eager factory was installed.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return False
+    asyncio.get_running_loop().set_task_factory(factory)
+    return True
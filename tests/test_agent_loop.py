@@ -0,0 +1,332 @@
+"""
+Tests for the agent loop's tool-calling behavior.
+
+Tests:
+- Tool advisor short-circuit for unviable tool calls
+- Response caching only for direct answers
+- Stats worker lifecycle
+- Speculative decoding reuse checks
+- Context guard settings from config
+- Background intent capture tasks
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nanobot.agent import compaction
+from nanobot.agent.loop import AgentLoop
+from nanobot.agent.tool_advisor import ToolAdvisor
+from nanobot.agent.tools.base import Tool
+from nanobot.bus.queue import MessageBus
+from nanobot.config.schema import Config
+from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+
+
+class ScriptedProvider(LLMProvider):
+    """Provider that replays a fixed list of responses."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.calls = []
+
+    async def chat(self, messages, tools=None, model=None, max_tokens=4096, temperature=0.7):
+        self.calls.append([dict(m) for m in messages])
+        return self.responses.pop(0)
+
+    def get_default_model(self):
+        return "test-model"
+
+
+class SummarizingProvider(ScriptedProvider):
+    """Provider answering summary requests (max_tokens=500) with a summary and anything else with "done"."""
+
+    def __init__(self):
+        super().__init__([])
+
+    async def chat(self, messages, tools=None, model=None, max_tokens=4096, temperature=0.7):
+        self.calls.append([dict(m) for m in messages])
+        return LLMResponse(content="knowledge" if max_tokens == 500 else "done")
+
+
+@pytest.fixture
+def make_loop(workspace, tmp_path, monkeypatch):
+    """Build an AgentLoop around a scripted provider, with HOME isolated."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    def _make(responses, config=None, provider=None):
+        provider = provider or ScriptedProvider(responses)
+        return AgentLoop(MessageBus(), provider, workspace, config=config), provider
+
+    return _make
+
+
+def _read_file_call():
+    return LLMResponse(content="", tool_calls=[ToolCallRequest("1", "read_file", {"path": "x"})])
+
+
+def _broken_advisor():
+    """Advisor that has seen read_file fail for the test model every time."""
+    advisor = ToolAdvisor()
+    for _ in range(advisor.config.block_min_calls):
+        advisor.record_tool_call("test-model", "read_file", False, error="boom")
+    return advisor
+
+
+class TestUnviableShortCircuit:
+    """Tests for skipping tool calls the advisor knows fail."""
+
+    @pytest.mark.asyncio
+    async def test_all_unviable_ends_turn_without_second_call(self, make_loop):
+        """A round of only unviable calls ends the turn with the canned reply."""
+        loop, provider = make_loop([_read_file_call(), LLMResponse(content="unused")])
+        loop.tool_advisor = _broken_advisor()
+
+        reply = await loop.process_direct("read x")
+
+        assert reply == loop.UNVIABLE_TOOLS_REPLY.format("read_file")
+        assert len(provider.calls) == 1
+        assert loop.get_tool_status()["advisor_short_circuits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_short_circuit_reply_is_not_cached(self, make_loop):
+        """The canned reply must not be stored in the response cache."""
+        loop, _ = make_loop([_read_file_call()])
+        loop.tool_advisor = _broken_advisor()
+        loop.response_cache = MagicMock()
+        loop.response_cache.get.return_value = None
+        loop.cost_optimizer = MagicMock()
+        loop.cost_optimizer.should_cache.return_value = True
+
+        await loop.process_direct("read x")
+
+        loop.response_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_direct_answer_is_cached(self, make_loop):
+        """A first-call text answer is still cached."""
+        loop, _ = make_loop([LLMResponse(content="hello")])
+        loop.response_cache = MagicMock()
+        loop.response_cache.get.return_value = None
+        loop.cost_optimizer = MagicMock()
+        loop.cost_optimizer.should_cache.return_value = True
+
+        await loop.process_direct("hi")
+
+        loop.response_cache.set.assert_called_once()
+        assert loop.response_cache.set.call_args.args[1] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_viable_call_is_executed(self, make_loop, workspace):
+        """Calls without a bad track record still run."""
+        (workspace / "x").write_text("content")
+        loop, provider = make_loop([
+            LLMResponse(content="", tool_calls=[
+                ToolCallRequest("1", "read_file", {"path": str(workspace / "x")}),
+            ]),
+            LLMResponse(content="done"),
+        ])
+        loop.tool_advisor = ToolAdvisor()
+
+        reply = await loop.process_direct("read x")
+
+        assert reply == "done"
+        assert provider.calls[1][-1] == {
+            "role": "tool", "tool_call_id": "1", "name": "read_file", "content": "content",
+        }
+
+
+class TestStatsWorker:
+    """Tests for the background stats worker."""
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_worker_after_flush(self, make_loop):
+        """flush_stats() applies queued updates; stop() then cancels the worker."""
+        loop, _ = make_loop([LLMResponse(content="hello")])
+        loop.tool_advisor = MagicMock()
+
+        await loop.process_direct("hi")
+        loop._record_stats("advisor", model_id="m", tool_name="t", success=True)
+        worker = loop._stats_task
+        await loop.flush_stats()
+        loop.stop()
+        await asyncio.sleep(0)
+
+        loop.tool_advisor.record_tool_call.assert_called_once_with(
+            model_id="m", tool_name="t", success=True,
+        )
+        assert worker.cancelled()
+        assert loop._stats_task is None
+
+    @pytest.mark.asyncio
+    async def test_worker_starts_on_first_update(self, make_loop):
+        """Paths that bypass run() and process_direct() still get stats applied."""
+        loop, _ = make_loop([])
+        loop.tool_advisor = MagicMock()
+
+        loop._record_stats("advisor", model_id="m", tool_name="t", success=False)
+        await asyncio.sleep(0)
+
+        loop.tool_advisor.record_tool_call.assert_called_once()
+        assert loop._stats_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_flush_without_worker_applies_pending(self, make_loop):
+        """Updates left queued when the worker was cancelled are applied by the next flush."""
+        loop, _ = make_loop([])
+        loop.tool_advisor = MagicMock()
+
+        loop._stats_queue.put_nowait(("advisor", {"model_id": "m", "tool_name": "t", "success": False}))
+        await loop.flush_stats()
+
+        loop.tool_advisor.record_tool_call.assert_called_once()
+        assert loop._stats_queue.empty()
+
+
+class SlowReadTool(Tool):
+    """Read-only tool that takes long enough for a speculative call to win."""
+
+    is_mutating = False
+
+    @property
+    def name(self):
+        return "slow_read"
+
+    @property
+    def description(self):
+        return "Slowly read a key."
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {"key": {"type": "string"}}}
+
+    async def execute(self, key="", **kwargs):
+        await asyncio.sleep(0.05)
+        return f"value of {key}"
+
+
+def _slow_read(call_id, key):
+    return ToolCallRequest(call_id, "slow_read", {"key": key})
+
+
+class TestSpeculativeDecode:
+    """Tests for reusing responses decoded while tools run."""
+
+    def test_new_read_only_call_is_reusable(self, make_loop):
+        loop, _ = make_loop([])
+        loop.tools.register(SlowReadTool())
+        response = LLMResponse(content="", tool_calls=[_slow_read("call_b", "b")])
+        assert loop._is_reusable_speculation(response, [_slow_read("call_a", "a")])
+
+    def test_rejects_repeat_of_pending_call(self, make_loop):
+        """Re-issuing a pending call means the model wanted its result."""
+        loop, _ = make_loop([])
+        loop.tools.register(SlowReadTool())
+        response = LLMResponse(content="", tool_calls=[_slow_read("call_b", "a")])
+        assert not loop._is_reusable_speculation(response, [_slow_read("call_a", "a")])
+
+    def test_rejects_reference_to_pending_id(self, make_loop):
+        loop, _ = make_loop([])
+        loop.tools.register(SlowReadTool())
+        response = LLMResponse(content="", tool_calls=[_slow_read("call_b", "output of call_a")])
+        assert not loop._is_reusable_speculation(response, [_slow_read("call_a", "a")])
+
+    def test_rejects_final_answer(self, make_loop):
+        loop, _ = make_loop([])
+        response = LLMResponse(content="done")
+        assert not loop._is_reusable_speculation(response, [_slow_read("call_a", "a")])
+
+    @pytest.mark.asyncio
+    async def test_kept_response_runs_context_guard(self, make_loop):
+        """The iteration acting on a kept response still checks the context."""
+        loop, provider = make_loop([
+            LLMResponse(content="", tool_calls=[_slow_read("call_a", "a")]),
+            LLMResponse(content="", tool_calls=[_slow_read("call_b", "b")]),  # Kept
+            LLMResponse(content="speculative answer"),  # Discarded
+            LLMResponse(content="done"),
+        ])
+        loop.tools.register(SlowReadTool())
+        loop.speculative_decode = True
+        loop.context_guard = MagicMock()
+        loop.context_guard.compact_if_needed = AsyncMock(side_effect=lambda messages, *a, **kw: messages)
+
+        reply = await loop.process_direct("read a and b")
+
+        assert reply == "done"
+        assert len(provider.calls) == 4
+        assert loop.context_guard.compact_if_needed.await_count == 3
+
+
+class TestContextGuardConfig:
+    """Tests for configuring compaction through agents.compaction."""
+
+    def test_defaults(self, make_loop):
+        loop, _ = make_loop([], config=Config())
+        assert not loop.context_guard.rubric_gate
+        assert loop.context_guard.strategy == "always_on"
+
+    def test_rubric_gate_from_config(self, make_loop):
+        config = Config()
+        config.agents.compaction.rubric_gate = True
+        config.agents.compaction.probe_interval = 5
+
+        loop, _ = make_loop([], config=config)
+
+        assert loop.context_guard.rubric_gate
+        assert loop.context_guard.probe_interval == 5
+
+    @pytest.mark.asyncio
+    async def test_focus_strategy_compacts_turn_context(self, make_loop, monkeypatch):
+        """With strategy "focus", an over-full turn gets a knowledge block."""
+        monkeypatch.setattr(compaction, "TIKTOKEN_AVAILABLE", False)
+        config = Config()
+        config.agents.compaction.strategy = "focus"
+        # Other subsystems enabled by the default config call the provider too
+        loop, provider = make_loop([], config=config, provider=SummarizingProvider())
+        guard = loop.context_guard
+        guard.max_tokens = 3000
+        guard.preserve_recent = 2
+        session = loop.sessions.get_or_create("cli:direct")
+        session.add_message("user", "first question")
+        session.add_message("assistant", "long answer " + "x" * 12000)
+        session.add_message("user", "second question")
+        session.add_message("assistant", "short answer")
+
+        reply = await loop.process_direct("third question")
+
+        assert reply == "done"
+        sent = next(call for call in provider.calls if "third question" in call[-1]["content"])
+        blocks = [m for m in sent if (m.get("content") or "").startswith(guard.KNOWLEDGE_BLOCK_PREFIX)]
+        assert len(blocks) == 1
+        assert not any("x" * 100 in (m.get("content") or "") for m in sent)
+
+
+class TestIntentCapture:
+    """Tests for tracking background intent captures."""
+
+    @pytest.mark.asyncio
+    async def test_captures_are_kept_until_cleanup(self, make_loop):
+        """Every capture in flight stays referenced and cleanup() awaits them all."""
+        loop, _ = make_loop([LLMResponse(content="one"), LLMResponse(content="two")])
+        release = asyncio.Event()
+        captured = []
+
+        async def capture_intent(message, **kwargs):
+            await release.wait()
+            captured.append(message)
+
+        loop.intent_tracker = MagicMock()
+        loop.intent_tracker.capture_intent = capture_intent
+
+        await loop.process_direct("first")
+        await loop.process_direct("second")
+        assert len(loop._intent_tasks) == 2
+
+        release.set()
+        loop.subagents = None  # SubagentManager has no cleanup() to call
+        await loop.cleanup()
+
+        assert sorted(captured) == ["first", "second"]
+        assert not loop._intent_tasks
@@ -0,0 +1,43 @@
+"""
+Tests for the server's agent manager.
+
+Tests:
+- Agent shutdown and replacement
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nanobot.server.agent_manager import AgentManager, AgentState
+
+
+def _agent():
+    agent = MagicMock()
+    agent.flush_sessions = AsyncMock()
+    agent.flush_stats = AsyncMock()
+    return agent
+
+
+class TestShutdown:
+    """Tests for closing the managed agent."""
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_and_stops_agent(self, workspace):
+        """Pending sessions and stats are written before the agent is stopped."""
+        manager = AgentManager(MagicMock(), workspace)
+        agent = manager._agent = _agent()
+
+        await manager.shutdown()
+
+        agent.flush_sessions.assert_awaited_once()
+        agent.flush_stats.assert_awaited_once()
+        agent.stop.assert_called_once()
+        assert manager.agent is None
+        assert manager.state == AgentState.UNINITIALIZED
+
+    @pytest.mark.asyncio
+    async def test_close_without_agent_is_noop(self, workspace):
+        manager = AgentManager(MagicMock(), workspace)
+        await manager._close_agent()
+        assert manager.agent is None
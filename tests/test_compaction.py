@@ -0,0 +1,270 @@
+"""
+Tests for the context guard.
+
+Tests:
+- Block splitting for parallel summaries
+- Single character scan per threshold check
+- Character fast path with multi-token scripts
+- Persistent summary cache
+- Rubric gate before compaction
+- Focus compaction strategy
+"""
+
+import pytest
+
+from nanobot.agent import compaction
+from nanobot.agent.compaction import ContextGuard
+from nanobot.providers.base import LLMResponse
+
+
+class SummaryProvider:
+    """Provider answering rubric probes with a fixed verdict and summaries with a counter."""
+
+    def __init__(self, verdict="COMPRESS", fail=False):
+        self.verdict = verdict
+        self.fail = fail
+        self.prompts = []
+
+    async def chat(self, messages, max_tokens=4096, temperature=0.7, **kwargs):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        if max_tokens == 4:
+            return LLMResponse(content=self.verdict)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return LLMResponse(content=f"summary {len(self.prompts)}")
+
+    @property
+    def summary_calls(self):
+        return [p for p in self.prompts if "COMPRESS" not in p]
+
+    @property
+    def rubric_calls(self):
+        return [p for p in self.prompts if "COMPRESS" in p]
+
+
+@pytest.fixture
+def make_guard(monkeypatch):
+    """Build a ContextGuard that estimates tokens instead of using tiktoken."""
+    monkeypatch.setattr(compaction, "TIKTOKEN_AVAILABLE", False)
+
+    def _make(**kwargs):
+        return ContextGuard(**kwargs)
+
+    return _make
+
+
+def _messages(count, size=4000):
+    return [{"role": "user", "content": f"{i} " + "x" * size} for i in range(count)]
+
+
+class TestSplitBlocks:
+    """Tests for ContextGuard._split_blocks."""
+
+    def test_reuses_counted_messages(self, make_guard, monkeypatch):
+        """Only messages missing from the last count are tokenized again."""
+        guard = make_guard(parallel_blocks=4)
+        messages = _messages(8)
+        guard.count_tokens_incremental(messages[:6])
+
+        counted = []
+        original = guard._count_per_message
+        monkeypatch.setattr(
+            guard, "_count_per_message", lambda msgs: counted.extend(msgs) or original(msgs)
+        )
+        blocks = guard._split_blocks(messages)
+
+        assert counted == messages[6:]
+        assert [msg for block in blocks for msg in block] == messages
+        assert len(blocks) == 4
+
+
+class TestThresholdCheck:
+    """Tests for the async threshold check."""
+
+    @pytest.mark.asyncio
+    async def test_characters_scanned_once(self, make_guard, monkeypatch):
+        """The executor does not repeat the character fast path."""
+        guard = make_guard(max_tokens=1000)
+        scans = []
+        original = guard._below_threshold_by_chars
+        monkeypatch.setattr(
+            guard, "_below_threshold_by_chars", lambda msgs: scans.append(1) or original(msgs)
+        )
+
+        count, needed = await guard._acount_and_check(_messages(2))
+
+        assert needed
+        assert count > 800
+        assert len(scans) == 1
+
+
+class TestSummaryCache:
+    """Tests for reusing summaries across guards."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_provider(self, make_guard, tmp_path):
+        """The same messages are summarized once, also by a new guard on the same file."""
+        path = tmp_path / "summaries.json"
+        messages = _messages(3, size=100)
+        provider = SummaryProvider()
+
+        first = await make_guard(summary_cache_path=path)._generate_summary(messages, provider)
+        again = await make_guard(summary_cache_path=path)._generate_summary(messages, provider)
+
+        assert first == again == "summary 1"
+        assert len(provider.summary_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_on_different_messages(self, make_guard, tmp_path):
+        guard = make_guard(summary_cache_path=tmp_path / "summaries.json")
+        provider = SummaryProvider()
+
+        await guard._generate_summary(_messages(3, size=100), provider)
+        await guard._generate_summary(_messages(4, size=100), provider)
+
+        assert len(provider.summary_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_is_not_cached(self, make_guard, tmp_path):
+        """A failed summary is not persisted, so the next call retries."""
+        guard = make_guard(summary_cache_path=tmp_path / "summaries.json")
+        messages = _messages(3, size=100)
+
+        fallback = await guard._generate_summary(messages, SummaryProvider(fail=True))
+        provider = SummaryProvider()
+        summary = await guard._generate_summary(messages, provider)
+
+        assert fallback.startswith("[Previous conversation")
+        assert summary == "summary 1"
+
+
+class TestRubricGate:
+    """Tests for asking the model before compacting."""
+
+    def _guard(self, make_guard):
+        return make_guard(max_tokens=1000, preserve_recent=2, rubric_gate=True, probe_interval=2)
+
+    @pytest.mark.asyncio
+    async def test_continue_defers_compaction(self, make_guard):
+        """CONTINUE keeps the context and skips the next probe_interval probes."""
+        guard = self._guard(make_guard)
+        messages = _messages(9, size=360)
+        provider = SummaryProvider(verdict="CONTINUE")
+
+        for _ in range(3):
+            assert await guard.compact_if_needed(messages, provider) is messages
+
+        assert len(provider.rubric_calls) == 1
+        assert not provider.summary_calls
+
+    @pytest.mark.asyncio
+    async def test_compress_compacts(self, make_guard):
+        guard = self._guard(make_guard)
+        messages = _messages(9, size=360)
+        provider = SummaryProvider(verdict="COMPRESS")
+
+        compacted = await guard.compact_if_needed(messages, provider)
+
+        assert len(provider.rubric_calls) == 1
+        assert len(compacted) == 3
+        assert compacted[0]["content"].startswith("[Context Summary]")
+
+    @pytest.mark.asyncio
+    async def test_hard_limit_skips_probe(self, make_guard):
+        """Contexts past HARD_LIMIT_RATIO are compacted without asking."""
+        guard = self._guard(make_guard)
+        messages = _messages(12, size=400)
+        provider = SummaryProvider(verdict="CONTINUE")
+
+        compacted = await guard.compact_if_needed(messages, provider)
+
+        assert not provider.rubric_calls
+        assert len(compacted) == 3
+
+
+class TestFocusStrategy:
+    """Tests for the focus compaction strategy."""
+
+    def _history(self):
+        return [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "short question"},
+            {"role": "assistant", "content": "", "tool_calls": [
+                {"id": "call_1", "type": "function", "function": {"name": "read_file", "arguments": "{}"}},
+            ]},
+            {"role": "tool", "tool_call_id": "call_1", "name": "read_file", "content": "x" * 4000},
+            {"role": "user", "content": "latest question"},
+            {"role": "assistant", "content": "latest answer"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_summarizes_low_relevance_segments(self, make_guard):
+        """Long tool output is summarized; short user turns and the tail are kept."""
+        guard = make_guard(max_tokens=1000, preserve_recent=2, strategy="focus")
+        provider = SummaryProvider()
+
+        compacted = await guard.compact_if_needed(self._history(), provider)
+
+        assert [m["role"] for m in compacted] == ["system", "system", "user", "user", "assistant"]
+        assert compacted[1]["content"].startswith(guard.KNOWLEDGE_BLOCK_PREFIX)
+        assert compacted[2]["content"] == "short question"
+        assert not any(m["role"] == "tool" for m in compacted)
+
+    @pytest.mark.asyncio
+    async def test_knowledge_block_is_replaced(self, make_guard):
+        """A second compaction folds the old block into one new block."""
+        guard = make_guard(max_tokens=1000, preserve_recent=2, strategy="focus")
+        provider = SummaryProvider()
+        compacted = await guard.compact_if_needed(self._history(), provider)
+
+        compacted += self._history()[1:4]
+        compacted = await guard.compact_if_needed(compacted, provider)
+
+        blocks = [
+            m for m in compacted
+            if (m.get("content") or "").startswith(guard.KNOWLEDGE_BLOCK_PREFIX)
+        ]
+        assert len(blocks) == 1
+        assert provider.summary_calls[-1].count("summary 1") == 1
+
+    def test_unknown_strategy_rejected(self, make_guard):
+        with pytest.raises(ValueError):
+            make_guard(strategy="sometimes")
+
+
+class TwoTokensPerChar:
+    """Encoder stand-in for scripts that need two tokens per character."""
+
+    def encode_batch(self, texts):
+        return [[0] * (2 * len(text)) for text in texts]
+
+
+class TestCharacterFastPath:
+    """Tests for skipping tokenization on short contexts."""
+
+    def test_multi_token_text_is_tokenized(self, make_guard, monkeypatch):
+        """CJK text under the threshold in characters but over it in tokens is caught."""
+        guard = make_guard(max_tokens=1000)
+        monkeypatch.setattr(compaction, "TIKTOKEN_AVAILABLE", True)
+        monkeypatch.setattr(compaction, "_get_encoder", lambda model: TwoTokensPerChar())
+        messages = [{"role": "user", "content": "漢字" * 250}]
+
+        assert guard.needs_compaction(messages)
+
+    def test_short_text_skips_tokenizer(self, make_guard, monkeypatch):
+        guard = make_guard(max_tokens=1000)
+        monkeypatch.setattr(guard, "count_tokens_incremental", None)  # Must not be called
+
+        assert not guard.needs_compaction([{"role": "user", "content": "hello"}])
+
+    def test_headroom_accounts_for_worst_case(self, make_guard):
+        """Appended messages only fit the headroom at the worst-case token rate."""
+        guard = make_guard(max_tokens=1000)
+        messages = [{"role": "user", "content": "x" * 100}]
+        assert guard._below_threshold_by_chars(messages)
+
+        messages.append({"role": "assistant", "content": "y" * 100})
+        assert guard._within_headroom(messages)
+        messages.append({"role": "user", "content": "z" * 100})
+        assert not guard._within_headroom(messages)
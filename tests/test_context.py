@@ -0,0 +1,89 @@
+"""
+Tests for prompt-prefix stability.
+
+Tests:
+- Byte-identical system prefix and tools across turns
+- Append-only messages across tool iterations
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+
+
+class RecordingProvider(LLMProvider):
+    """Provider that replays fixed responses and records each request as JSON."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    async def chat(self, messages, tools=None, model=None, max_tokens=4096, temperature=0.7):
+        self.requests.append((json.dumps(messages, sort_keys=True), json.dumps(tools, sort_keys=True)))
+        return self.responses.pop(0)
+
+    def get_default_model(self):
+        return "test-model"
+
+
+def _prefix_hash(request):
+    """Hash the leading system messages and the tool definitions of a request."""
+    messages_json, tools_json = request
+    messages = json.loads(messages_json)
+    prefix = []
+    for message in messages:
+        if message["role"] != "system":
+            break
+        prefix.append(message)
+    return hashlib.sha256((json.dumps(prefix, sort_keys=True) + tools_json).encode()).hexdigest()
+
+
+@pytest.fixture
+def make_loop(workspace, tmp_path, monkeypatch):
+    """Build an AgentLoop around a recording provider, with HOME isolated."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    def _make(responses):
+        provider = RecordingProvider(responses)
+        return AgentLoop(MessageBus(), provider, workspace), provider
+
+    return _make
+
+
+class TestPromptPrefix:
+    """Tests for keeping the cacheable prompt prefix stable."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_hash_equal_across_turns(self, make_loop):
+        """Two consecutive turns send the same system prefix and tools, byte for byte."""
+        loop, provider = make_loop([LLMResponse(content="one"), LLMResponse(content="two")])
+
+        await loop.process_direct("first question")
+        await loop.process_direct("second question")
+
+        first, second = provider.requests
+        assert _prefix_hash(first) == _prefix_hash(second)
+        assert "first question" not in json.loads(first[0])[0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_iterations_only_append(self, make_loop, workspace):
+        """A tool round re-sends the previous request unchanged, plus new messages."""
+        (workspace / "notes.txt").write_text("hello")
+        loop, provider = make_loop([
+            LLMResponse(content="", tool_calls=[
+                ToolCallRequest("call_1", "read_file", {"path": str(workspace / "notes.txt")}),
+            ]),
+            LLMResponse(content="done"),
+        ])
+
+        await loop.process_direct("read my notes")
+
+        first, second = (json.loads(messages) for messages, _ in provider.requests)
+        assert second[:len(first)] == first
+        assert [m["role"] for m in second[len(first):]] == ["assistant", "tool"]
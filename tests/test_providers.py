@@ -0,0 +1,27 @@
+"""
+Tests for provider data types.
+
+Tests:
+- Tool call argument parsing
+"""
+
+from nanobot.providers.base import ToolCallRequest
+
+
+class TestToolCallFromJson:
+    """Tests for ToolCallRequest.from_json."""
+
+    def test_parses_arguments(self):
+        call = ToolCallRequest.from_json("1", "read_file", '{"path": "x"}')
+        assert call.arguments == {"path": "x"}
+        assert call.serialized_arguments() == '{"path": "x"}'
+
+    def test_accepts_json_outside_orjson_limits(self):
+        """NaN and integers wider than 64 bits fall back to stdlib json."""
+        call = ToolCallRequest.from_json("1", "calc", '{"n": 123456789012345678901234567890, "x": NaN}')
+        assert call.arguments["n"] == 123456789012345678901234567890
+        assert call.arguments["x"] != call.arguments["x"]
+
+    def test_invalid_json_is_kept_raw(self):
+        call = ToolCallRequest.from_json("1", "read_file", '{"path": ')
+        assert call.arguments == {"raw": '{"path": '}
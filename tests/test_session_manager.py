@@ -0,0 +1,74 @@
+"""
+Tests for session persistence.
+
+Tests:
+- Incremental serialization of appended messages
+- Reserialization after the message list is replaced
+- Bounded serialized-lines cache
+- Serialize/write round trip
+"""
+
+import pytest
+
+from nanobot.session.manager import SessionManager
+
+
+@pytest.fixture
+def manager(workspace, tmp_path, monkeypatch):
+    """SessionManager with HOME isolated to a temp directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return SessionManager(workspace)
+
+
+class TestSerializedLines:
+    """Tests for the per-session serialized-lines cache."""
+
+    def test_appended_messages_reuse_cached_lines(self, manager):
+        """A second save extends the cached lines instead of rebuilding them."""
+        session = manager.get_or_create("cli:a")
+        session.add_message("user", "one")
+        first = manager._message_lines(session)
+        session.add_message("assistant", "two")
+        second = manager._message_lines(session)
+
+        assert second is first
+        assert len(second) == 2
+
+    def test_replaced_list_is_reserialized(self, manager):
+        """clear() replaces the list, so stale lines are not reused."""
+        session = manager.get_or_create("cli:a")
+        session.add_message("user", "one")
+        manager._message_lines(session)
+        session.clear()
+        session.add_message("user", "fresh")
+
+        lines = manager._message_lines(session)
+
+        assert len(lines) == 1
+        assert "fresh" in lines[0]
+
+    def test_cache_is_bounded(self, manager):
+        """Only the most recently saved sessions keep their lines."""
+        for i in range(manager.LINE_CACHE_SIZE + 5):
+            session = manager.get_or_create(f"cli:{i}")
+            session.add_message("user", "hi")
+            manager.serialize(session)
+
+        assert len(manager._lines) == manager.LINE_CACHE_SIZE
+        assert "cli:0" not in manager._lines
+        assert f"cli:{manager.LINE_CACHE_SIZE + 4}" in manager._lines
+
+
+class TestSaveRoundTrip:
+    """Tests for writing and reloading sessions."""
+
+    def test_serialize_write_reload(self, manager, workspace):
+        """Text from serialize() written by write() loads back intact."""
+        session = manager.get_or_create("cli:a")
+        session.add_message("user", "hello")
+        session.add_message("assistant", "hi there")
+        manager.write(session.key, manager.serialize(session))
+
+        reloaded = SessionManager(workspace)._load("cli:a")
+
+        assert [m["content"] for m in reloaded.messages] == ["hello", "hi there"]
@@ -0,0 +1,94 @@
+"""
+Tests for the tool advisor.
+
+Tests:
+- Background flush thread shutdown
+- Stats file format
+- Viability of known-failing combinations
+"""
+
+import json
+
+from nanobot.agent.tool_advisor import AdvisorConfig, ToolAdvisor
+
+
+class TestClose:
+    """Tests for ToolAdvisor.close."""
+
+    def test_close_stops_thread_and_saves(self, tmp_path):
+        """close() ends the flush thread and writes pending changes."""
+        path = tmp_path / "advisor.json"
+        advisor = ToolAdvisor(path, AdvisorConfig(flush_interval_seconds=3600))
+        thread = advisor._flush_thread
+        advisor.record_tool_call("m", "read_file", True)
+
+        advisor.close()
+
+        assert not thread.is_alive()
+        assert advisor._flush_thread is None
+        assert "m:read_file" in json.loads(path.read_text())["stats"]
+
+    def test_failed_save_stays_dirty(self, tmp_path):
+        """A failed write leaves the changes marked for the next flush."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        advisor = ToolAdvisor(blocker / "advisor.json", AdvisorConfig(flush_interval_seconds=3600))
+        advisor.record_tool_call("m", "read_file", True)
+
+        advisor.close()
+
+        assert advisor._dirty
+        advisor.storage_path = None  # Skip the retry at interpreter exit
+
+
+class TestSaveStats:
+    """Tests for the saved statistics file."""
+
+    def test_saved_file_is_indented_and_replaced(self, tmp_path):
+        """Stats are written indented, via a temp file that is swapped in."""
+        path = tmp_path / "advisor.json"
+        path.write_text("old")
+        advisor = ToolAdvisor(path, AdvisorConfig(flush_interval_seconds=3600))
+        advisor.record_tool_call("m", "read_file", False, error="boom")
+
+        advisor.close()
+
+        text = path.read_text()
+        assert text.startswith('{\n  "version"')
+        assert json.loads(text)["stats"]["m:read_file"]["total_calls"] == 1
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestIsViable:
+    """Tests for ToolAdvisor.is_viable."""
+
+    def _failing(self, advisor, calls):
+        for _ in range(calls):
+            advisor.record_tool_call("m", "read_file", False, error="boom")
+
+    def test_unknown_combination_is_viable(self):
+        assert ToolAdvisor().is_viable("m", "read_file")
+
+    def test_too_few_calls_is_viable(self):
+        advisor = ToolAdvisor()
+        self._failing(advisor, advisor.config.block_min_calls - 1)
+        assert advisor.is_viable("m", "read_file")
+
+    def test_failing_combination_is_not_viable(self):
+        advisor = ToolAdvisor()
+        self._failing(advisor, advisor.config.block_min_calls)
+        assert not advisor.is_viable("m", "read_file")
+        assert advisor.is_viable("other-model", "read_file")
+
+    def test_occasional_success_is_viable(self):
+        advisor = ToolAdvisor(config=AdvisorConfig(block_min_calls=4, block_max_success_rate=0.1))
+        self._failing(advisor, 3)
+        advisor.record_tool_call("m", "read_file", True)
+        assert advisor.is_viable("m", "read_file")
+
+    def test_retried_after_idle_period(self):
+        """An idle combination is let through again to see if it recovered."""
+        advisor = ToolAdvisor()
+        self._failing(advisor, advisor.config.block_min_calls)
+        advisor._peek_stats("m", "read_file").last_used -= advisor.config.block_retry_seconds
+        assert advisor.is_viable("m", "read_file")
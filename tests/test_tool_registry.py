@@ -0,0 +1,174 @@
+"""
+Tests for the tool registry.
+
+Tests:
+- Success reporting for tool results
+- Ordering and isolation in execute_calls
+"""
+
+import asyncio
+
+import pytest
+
+from nanobot.agent.tools.base import Tool, ToolResult
+from nanobot.agent.tools.filesystem import ReadFileTool
+from nanobot.agent.tools.registry import ToolRegistry
+from nanobot.providers.base import ToolCallRequest
+
+
+class EchoTool(Tool):
+    """Tool that returns a fixed result, or raises it if it is an exception."""
+
+    def __init__(self, name="echo", result="ok", is_mutating=False):
+        self._name = name
+        self.result = result
+        self.is_mutating = is_mutating
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def description(self):
+        return "Echo a fixed result."
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {}}
+
+    async def execute(self, **kwargs):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+class TestExecuteChecked:
+    """Tests for ToolRegistry.execute_checked."""
+
+    @pytest.mark.asyncio
+    async def test_missing_tool_fails(self, registry):
+        result, ok = await registry.execute_checked("nope", {})
+        assert not ok
+        assert result == "Error: Tool 'nope' not found"
+
+    @pytest.mark.asyncio
+    async def test_exception_fails(self, registry):
+        registry.register(EchoTool(result=RuntimeError("boom")))
+        result, ok = await registry.execute_checked("echo", {})
+        assert not ok
+        assert result == "Error executing echo: boom"
+
+    @pytest.mark.asyncio
+    async def test_error_string_fails(self, registry):
+        registry.register(EchoTool(result="Error: bad input"))
+        assert await registry.execute_checked("echo", {}) == ("Error: bad input", False)
+
+    @pytest.mark.asyncio
+    async def test_error_like_text_succeeds(self, registry):
+        """Only the "Error:" contract counts, not any text mentioning errors."""
+        registry.register(EchoTool(result="error: in line 3 of the log"))
+        _, ok = await registry.execute_checked("echo", {})
+        assert ok
+
+    @pytest.mark.asyncio
+    async def test_tool_result_is_converted(self, registry):
+        registry.register(EchoTool(result=ToolResult(success=False, error="nope")))
+        assert await registry.execute_checked("echo", {}) == ("Error: nope", False)
+
+    @pytest.mark.asyncio
+    async def test_read_file_content_is_never_an_error(self, registry, tmp_path):
+        """File content starting with "Error:" is a successful read."""
+        path = tmp_path / "log.txt"
+        path.write_text("Error: disk full")
+        registry.register(ReadFileTool())
+
+        assert await registry.execute_checked("read_file", {"path": str(path)}) == (
+            "Error: disk full", True,
+        )
+        _, ok = await registry.execute_checked("read_file", {"path": str(tmp_path / "missing")})
+        assert not ok
+
+
+class TracedTool(Tool):
+    """Tool that sleeps for the requested delay and logs when it starts and ends."""
+
+    def __init__(self, name, events, is_mutating):
+        self._name = name
+        self.events = events
+        self.is_mutating = is_mutating
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def description(self):
+        return "Traced tool."
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {"tag": {"type": "string"}}}
+
+    async def execute(self, tag="", delay=0.0, **kwargs):
+        self.events.append(("start", tag))
+        await asyncio.sleep(delay)
+        self.events.append(("end", tag))
+        return tag
+
+
+class TestExecuteCalls:
+    """Tests for ToolRegistry.execute_calls."""
+
+    @pytest.fixture
+    def traced(self, registry):
+        events = []
+        registry.register(TracedTool("read", events, is_mutating=False))
+        registry.register(TracedTool("write", events, is_mutating=True))
+        return events
+
+    def _call(self, name, tag, delay=0.0):
+        return ToolCallRequest(tag, name, {"tag": tag, "delay": delay})
+
+    @pytest.mark.asyncio
+    async def test_results_follow_emission_order(self, registry, traced):
+        """Concurrent reads finishing out of order still return in call order."""
+        calls = [self._call("read", "a", 0.03), self._call("read", "b", 0.0), self._call("read", "c", 0.01)]
+
+        results = await registry.execute_calls(calls)
+
+        assert results == ["a", "b", "c"]
+        assert [tag for kind, tag in traced if kind == "end"] == ["b", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_mutating_call_runs_alone(self, registry, traced):
+        """Reads before a write finish first; reads after it start after it ends."""
+        calls = [
+            self._call("read", "r1", 0.02),
+            self._call("write", "w", 0.01),
+            self._call("read", "r2"),
+            self._call("read", "r3"),
+        ]
+
+        results = await registry.execute_calls(calls)
+
+        assert results == ["r1", "w", "r2", "r3"]
+        write_start = traced.index(("start", "w"))
+        write_end = traced.index(("end", "w"))
+        assert traced.index(("end", "r1")) < write_start
+        assert write_end == write_start + 1
+        assert traced.index(("start", "r2")) > write_end
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_error_result(self, registry):
+        """A custom executor raising is reported like a registry failure."""
+        calls = [ToolCallRequest("1", "echo", {})]
+
+        async def execute(tc):
+            raise RuntimeError("boom")
+
+        assert await registry.execute_calls(calls, execute) == ["Error executing echo: boom"]